@@ -6,18 +6,30 @@ from __future__ import annotations
 import argparse
 import re
 from pathlib import Path
+from typing import Iterable
 
 
 VERSION_HEADING_RE = re.compile(r"^##\s+v?(\d+\.\d+\.\d+)\b")
 
 
 def extract_release_notes(changelog_text: str, version: str) -> str:
-    lines = changelog_text.splitlines()
+    return extract_release_notes_from_lines(changelog_text.splitlines(), version)
+
+
+def extract_release_notes_from_file(changelog: Path, version: str) -> str:
+    """Stream CHANGELOG lines from disk, stopping once the target section ends."""
+    with changelog.open("r", encoding="utf-8") as handle:
+        return extract_release_notes_from_lines((line.rstrip("\r\n") for line in handle), version)
+
+
+def extract_release_notes_from_lines(lines: Iterable[str], version: str) -> str:
     capture = False
     out: list[str] = []
 
     for line in lines:
-        heading_match = VERSION_HEADING_RE.match(line.strip())
+        # Cheap prefix check first: only `##` lines can be version headings.
+        stripped = line.lstrip()
+        heading_match = VERSION_HEADING_RE.match(stripped) if stripped.startswith("##") else None
         if heading_match:
             heading_version = heading_match.group(1)
             if capture:
@@ -42,9 +54,7 @@ def main() -> int:
     parser.add_argument("--changelog", default="CHANGELOG.md")
     args = parser.parse_args()
 
-    changelog = Path(args.changelog)
-    text = changelog.read_text(encoding="utf-8")
-    notes = extract_release_notes(text, args.version)
+    notes = extract_release_notes_from_file(Path(args.changelog), args.version)
     print(notes, end="")
     return 0
 
@@ -7,26 +7,102 @@ import argparse
 import datetime as dt
 import json
 import subprocess
+import sys
 from pathlib import Path
-from typing import Any
-
-
-def run_gh_issue_list(repo: str, limit: int) -> list[dict[str, Any]]:
-    cmd = [
-        "gh",
-        "issue",
-        "list",
-        "--repo",
-        repo,
-        "--state",
-        "open",
-        "--limit",
-        str(limit),
-        "--json",
-        "number,title,url,labels,createdAt,updatedAt,author",
-    ]
-    output = subprocess.check_output(cmd, text=True)
-    return json.loads(output)
+from typing import Any, Callable
+
+# Ensure repository root is importable when running as a script.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.lib import fastjson
+
+
+ISSUES_QUERY = """
+query($owner: String!, $name: String!, $limit: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $limit, after: $after, states: OPEN, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        url
+        createdAt
+        updatedAt
+        author { login }
+        labels(first: 20) { nodes { name } }
+      }
+    }
+  }
+}
+"""
+
+# GitHub GraphQL connections cap `first` at 100 nodes per page.
+GRAPHQL_MAX_PAGE_SIZE = 100
+
+
+def flatten_issue_nodes(doc: dict[str, Any]) -> list[dict[str, Any]]:
+    """Flatten a GraphQL issues response into the `gh issue list --json` row shape."""
+    repository = (doc.get("data") or {}).get("repository") or {}
+    nodes = (repository.get("issues") or {}).get("nodes") or []
+
+    issues: list[dict[str, Any]] = []
+    for node in nodes:
+        if not isinstance(node, dict):
+            continue
+        issue = dict(node)
+        labels = node.get("labels")
+        issue["labels"] = list((labels or {}).get("nodes") or []) if isinstance(labels, dict) else []
+        issues.append(issue)
+    return issues
+
+
+def issue_page_cursor(doc: dict[str, Any]) -> str | None:
+    """Return the cursor for the next issues page, or None on the last page."""
+    repository = (doc.get("data") or {}).get("repository") or {}
+    page_info = (repository.get("issues") or {}).get("pageInfo") or {}
+    cursor = page_info.get("endCursor")
+    if page_info.get("hasNextPage") and isinstance(cursor, str) and cursor:
+        return cursor
+    return None
+
+
+def run_gh_issue_list(
+    repo: str,
+    limit: int,
+    check_output: Callable[[list[str]], bytes] = subprocess.check_output,
+) -> list[dict[str, Any]]:
+    """Fetch up to `limit` open issues via `gh api graphql`, one round-trip per 100."""
+    owner, _, name = repo.partition("/")
+    issues: list[dict[str, Any]] = []
+    cursor: str | None = None
+
+    while len(issues) < limit:
+        cmd = [
+            "gh",
+            "api",
+            "graphql",
+            "-f",
+            f"owner={owner}",
+            "-f",
+            f"name={name}",
+            "-F",
+            f"limit={min(GRAPHQL_MAX_PAGE_SIZE, limit - len(issues))}",
+            "-f",
+            f"query={ISSUES_QUERY}",
+        ]
+        if cursor is not None:
+            cmd.extend(["-f", f"after={cursor}"])
+
+        # Keep stdout as bytes: both orjson and stdlib json parse UTF-8 bytes directly.
+        doc = fastjson.loads(check_output(cmd))
+        issues.extend(flatten_issue_nodes(doc))
+        cursor = issue_page_cursor(doc)
+        if cursor is None:
+            break
+
+    return issues[:limit]
 
 
 def render_markdown(repo: str, issues: list[dict[str, Any]]) -> str:
@@ -56,19 +132,28 @@ def render_markdown(repo: str, issues: list[dict[str, Any]]) -> str:
         labels = [label.get("name", "") for label in issue.get("labels", []) if isinstance(label, dict)]
         labels_display = ", ".join(labels) if labels else "none"
 
-        lines.append(f"### #{number} — {title}")
-        lines.append(f"- URL: {url}")
-        lines.append(f"- Labels: {labels_display}")
-        lines.append(f"- Updated: {updated_at}")
-        lines.append("")
+        # One fragment per issue (trailing newline yields the blank separator line on join).
+        lines.append(
+            f"### #{number} — {title}\n"
+            f"- URL: {url}\n"
+            f"- Labels: {labels_display}\n"
+            f"- Updated: {updated_at}\n"
+        )
 
     return "\n".join(lines)
 
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Generate markdown snapshot of open GitHub issues")
     parser.add_argument("--repo", default="SeanKudrna/claw-control-room")
-    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--limit", type=positive_int, default=50)
     parser.add_argument(
         "--out",
         default="/Users/seankudrna/.openclaw/workspace/status/control-room-issues.md",
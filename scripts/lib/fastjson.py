@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""JSON helpers with an optional `orjson` fast path.
+
+`orjson` is not a hard dependency: when it is not installed these helpers fall back
+to stdlib `json` with the same `indent=2` + trailing-newline layout, raw UTF-8 text
+(non-ASCII is not escaped) and non-str dict keys stringified, so JSON-native payloads
+serialize to identical bytes on both paths.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def dumps_pretty_bytes(obj: Any) -> bytes:
+    """Serialize `obj` as 2-space indented UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        )
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Text variant of `dumps_pretty_bytes` for callers that need a `str` payload."""
+    return dumps_pretty_bytes(obj).decode("utf-8")
+
+
+def write_json(path: Path, obj: Any) -> None:
+    """Write pretty JSON to `path` without an extra str encode/decode round-trip."""
+    path.write_bytes(dumps_pretty_bytes(obj))
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from raw bytes (or text) without a separate decode pass."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
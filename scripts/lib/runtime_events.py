@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 from typing import Any, Dict, Iterable, List, Tuple
 
@@ -20,6 +21,11 @@ TERMINAL_EVENT_TYPES = {
     "stale_expired",
 }
 
+_sha256 = hashlib.sha256
+
+# Map `-`/space separators to `_` in one C-level pass.
+_TERMINAL_LABEL_TABLE = str.maketrans({"-": "_", " ": "_"})
+
 RUNNING_EVENT_TYPES = {
     "started",
     "heartbeat",
@@ -30,8 +36,13 @@ def normalize_terminal_event_type(value: Any) -> str:
     """Normalize heterogeneous terminal labels to canonical runtime values."""
     if not isinstance(value, str):
         return "finished"
+    return _normalize_terminal_str(value)
+
 
-    normalized = value.strip().lower().replace("-", "_").replace(" ", "_")
+@functools.lru_cache(maxsize=128)
+def _normalize_terminal_str(value: str) -> str:
+    # Status labels come from a tiny vocabulary, so memoizing skips the string rewrites.
+    normalized = value.strip().lower().translate(_TERMINAL_LABEL_TABLE)
     if normalized in TERMINAL_EVENT_TYPES:
         return normalized
     if normalized in {"ok", "success", "succeeded", "complete", "completed", "done"}:
@@ -52,8 +63,11 @@ def deterministic_event_id(
     source: str,
     source_offset: str,
 ) -> str:
+    # Event ids must stay sha256 so journal de-duplication keeps matching ids
+    # already persisted in `runtime-events.jsonl`. One f-string + one encode is
+    # cheaper than chaining per-field `update()` calls for these short inputs.
     material = f"{run_key}|{event_type}|{event_at_ms}|{source}|{source_offset}"
-    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+    return _sha256(material.encode("utf-8")).hexdigest()
 
 
 def build_event(
@@ -88,19 +102,17 @@ def event_sort_key(event: Dict[str, Any]) -> Tuple[int, int, str, str]:
     event_at_ms = event.get("eventAtMs")
     if not isinstance(event_at_ms, int):
         event_at_ms = 0
-    source = event.get("source")
-    source_offset = event.get("sourceOffset")
-    event_id = event.get("eventId")
     return (
         event_at_ms,
-        source_priority(source),
-        str(source_offset or ""),
-        str(event_id or ""),
+        source_priority(event.get("source")),
+        str(event.get("sourceOffset") or ""),
+        str(event.get("eventId") or ""),
     )
 
 
 def sort_events(events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    return sorted(list(events), key=event_sort_key)
+    # `sorted` computes each key exactly once (decorate-sort-undecorate), so no extra copy is needed.
+    return sorted(events, key=event_sort_key)
 
 
 def is_terminal_event_type(event_type: Any) -> bool:
@@ -3,11 +3,16 @@
 
 from __future__ import annotations
 
-import datetime as dt
+import functools
+import time
+from operator import itemgetter
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from scripts.lib.runtime_events import is_terminal_event_type
 
+LOCAL_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+MERGE_FILL_FIELDS = ("jobName", "summary", "sessionId", "sessionKey", "jobId", "activityType", "model", "thinking")
+
 
 def normalize_run_key(
     activity_type: str,
@@ -30,6 +35,18 @@ def normalize_run_key(
     return None
 
 
+@functools.lru_cache(maxsize=1024)
+def format_local_timestamp(epoch_ms: int, fmt: str = LOCAL_TIMESTAMP_FORMAT) -> str:
+    """Format epoch milliseconds in local time.
+
+    `time.localtime` resolves the local offset per timestamp (DST-correct) without
+    building intermediate UTC + local `datetime` objects for every row. Memoized because
+    rows and schedule points often share the same minute-aligned epoch values; call
+    `format_local_timestamp.cache_clear()` after changing `TZ` in-process.
+    """
+    return time.strftime(fmt, time.localtime(epoch_ms / 1000))
+
+
 def _normalize_candidate(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     run_key = row.get("runKey")
     started_at_ms = row.get("startedAtMs")
@@ -49,8 +66,8 @@ def _normalize_candidate(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return out
 
 
-def collect_candidates(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Collect canonical candidate rows, de-duplicated by runKey."""
+def merge_candidates(rows: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Merge candidate rows into one private row per runKey (insertion ordered, unsorted)."""
     by_run_key: Dict[str, Dict[str, Any]] = {}
 
     for raw in rows:
@@ -66,17 +83,24 @@ def collect_candidates(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
             by_run_key[run_key] = candidate
             continue
 
-        merged = dict(current)
-        merged["startedAtMs"] = min(current["startedAtMs"], candidate["startedAtMs"])
-        merged["lastSeenAtMs"] = max(current["lastSeenAtMs"], candidate["lastSeenAtMs"])
+        # `current` is already a private copy from `_normalize_candidate`, so merge in place.
+        current["startedAtMs"] = min(current["startedAtMs"], candidate["startedAtMs"])
+        current["lastSeenAtMs"] = max(current["lastSeenAtMs"], candidate["lastSeenAtMs"])
+
+        for field in MERGE_FILL_FIELDS:
+            if not current.get(field) and candidate.get(field):
+                current[field] = candidate[field]
 
-        for field in ("jobName", "summary", "sessionId", "sessionKey", "jobId", "activityType", "model", "thinking"):
-            if not merged.get(field) and candidate.get(field):
-                merged[field] = candidate[field]
+    return by_run_key
 
-        by_run_key[run_key] = merged
 
-    return sorted(by_run_key.values(), key=lambda row: (row["startedAtMs"], row["runKey"]))
+def collect_candidates(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Collect canonical candidate rows, de-duplicated by runKey.
+
+    Public helper: rows come back sorted by `(startedAtMs, runKey)`. `reconcile` calls
+    `merge_candidates` directly and sorts only surviving rows.
+    """
+    return sorted(merge_candidates(rows).values(), key=itemgetter("startedAtMs", "runKey"))
 
 
 def collect_terminals(events: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
@@ -117,14 +141,15 @@ def reconcile(
     stale_ms: int,
 ) -> Dict[str, Any]:
     """Reconcile active runtime rows using terminal dominance + stale expiry."""
-    normalized = collect_candidates(candidates)
+    # Terminals first, then a single pass over merged candidates; only surviving rows are sorted.
     terminals = collect_terminals(terminal_events)
+    merged = merge_candidates(candidates)
 
     active_rows: List[Dict[str, Any]] = []
     dropped_terminal = 0
     dropped_stale = 0
 
-    for row in normalized:
+    for row in merged.values():
         run_key = row["runKey"]
         terminal = terminals.get(run_key)
         if terminal is not None:
@@ -137,16 +162,12 @@ def reconcile(
             dropped_stale += 1
             continue
 
-        active = dict(row)
-        active["runningForMs"] = max(0, now_ms - row["startedAtMs"])
-        active["startedAtLocal"] = (
-            dt.datetime.fromtimestamp(row["startedAtMs"] / 1000, dt.timezone.utc)
-            .astimezone()
-            .strftime("%Y-%m-%d %H:%M:%S")
-        )
-        active_rows.append(active)
+        # Merged rows are private copies, so annotate them in place.
+        row["runningForMs"] = max(0, now_ms - row["startedAtMs"])
+        row["startedAtLocal"] = format_local_timestamp(row["startedAtMs"])
+        active_rows.append(row)
 
-    active_rows.sort(key=lambda item: (item.get("startedAtMs", 0), item.get("runKey", "")))
+    active_rows.sort(key=itemgetter("startedAtMs", "runKey"))
 
     return {
         "activeRuns": active_rows,
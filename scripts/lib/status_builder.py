@@ -9,43 +9,62 @@ This module is intentionally pure/side-effect-light so it can be reused by:
 
 from __future__ import annotations
 
+import ast
 import datetime as dt
-import json
+import functools
 import os
 import re
 import subprocess
+import sys
 import hashlib
+import heapq
+import importlib.util
+import itertools
+import time
 from collections import deque
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import AbstractSet, Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
-from scripts.lib.runtime_reconciler import normalize_run_key, reconcile
+from scripts.lib.fastjson import loads as loads_json, write_json
+from scripts.lib.runtime_reconciler import format_local_timestamp, normalize_run_key, reconcile
 
-BLOCK_RE = re.compile(r"^###\s+(\d{1,2}:\d{2})-(\d{1,2}:\d{2})\s+—\s+(.+)$")
-HEADING_RE = re.compile(r"^##\s+(.+)$")
 HEADING_TIME_RE = re.compile(r"^(\d{1,2}:\d{2})")
 TIME_RANGE_RE = re.compile(r"(\d{1,2}:\d{2})-(\d{1,2}:\d{2})")
 WORD_RE = re.compile(r"[a-z0-9]+")
+ISO_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(?::\d{2})?(?:Z|[+-]\d{2}:?\d{2})?")
+DATED_TIME_RE = re.compile(r"(\d{4}-\d{2}-\d{2})[ T](\d{1,2}:\d{2})")
+TODAY_STATUS_FIELD_RE = re.compile(r"^[ \t]*- (Primary focus|Running now):(.*)$", re.MULTILINE)
+PLAN_BLOCK_LINE_RE = re.compile(
+    r"^[ \t]*###[ \t]+(\d{1,2}:\d{2})-(\d{1,2}:\d{2})[ \t]+—[ \t]+(\S(?:.*\S)?)[ \t\r]*$",
+    re.MULTILINE,
+)
+SECTION_HEADING_LINE_RE = re.compile(r"^[ \t]*##[ \t]+(\S(?:.*\S)?)[ \t\r]*$", re.MULTILINE)
+# Memory feed lines: `## <heading>` (group 1 set) or `- <bullet>`; group 2 is the stripped text.
+ACTIVITY_LINE_RE = re.compile(r"^[ \t]*(?:(## )|- )[ \t]*(\S(?:.*\S)?)[ \t\r]*$", re.MULTILINE)
+SECTION_BULLET_LINE_RE = re.compile(r"^[ \t]*- [ \t]*(\S(?:.*\S)?)[ \t\r]*$", re.MULTILINE)
 
-SEMANTIC_STOPWORDS = {
-    "a",
-    "an",
-    "and",
-    "at",
-    "by",
-    "for",
-    "from",
-    "in",
-    "into",
-    "of",
-    "on",
-    "over",
-    "the",
-    "to",
-    "under",
-    "via",
-    "with",
-}
+SEMANTIC_STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "at",
+        "by",
+        "for",
+        "from",
+        "in",
+        "into",
+        "of",
+        "on",
+        "over",
+        "the",
+        "to",
+        "under",
+        "via",
+        "with",
+    }
+)
 
 NEXT_LANE_DEDUPE_TIME_GRACE_MINUTES = 5
 NEXT_LANE_DEDUPE_SIMILARITY_THRESHOLD = 0.6
@@ -62,9 +81,29 @@ CRON_RUN_SESSION_KEY_RE = re.compile(r"^agent:main:cron:([^:]+):run:([^:]+)$")
 MAIN_SESSION_KEY = "agent:main:main"
 RUNTIME_STALE_MS = 10 * 60 * 1000
 RUNTIME_MATERIALIZED_MAX_AGE_MS = 90 * 1000
+# Published `RuntimeRun` fields (src/types/status.ts), in payload order.
+_ACTIVE_RUN_KEYS = (
+    "jobId",
+    "jobName",
+    "sessionId",
+    "sessionKey",
+    "summary",
+    "startedAtMs",
+    "startedAtLocal",
+    "runningForMs",
+    "activityType",
+    "model",
+    "thinking",
+)
 MAIN_SESSION_RUNTIME_MAX_AGE_MS = 2 * 60 * 1000
 MAIN_SESSION_PENDING_CALL_MAX_AGE_MS = 10 * 60 * 1000
 MAIN_SESSION_LOCK_STALE_MS = 30 * 60 * 1000
+RELIABILITY_CACHE_TTL_SECONDS = 60
+RELIABILITY_TREND_TAIL_FACTOR = 4
+RELIABILITY_REPORT_ENTRYPOINT = "build_report"
+# Opt-in flag a watchdog script sets at module level (`CONTROL_ROOM_IN_PROCESS_REPORT = True`)
+# to declare that importing it is side-effect free.
+RELIABILITY_REPORT_IN_PROCESS_MARKER = "CONTROL_ROOM_IN_PROCESS_REPORT"
 ACTIVE_WORK_SINGLE_TIME_STALE_MINUTES = 90
 ACTIVE_WORK_COMPLETED_STALE_MINUTES = 15
 ACTIVE_WORK_COMPLETION_TOKENS = (
@@ -73,6 +112,46 @@ ACTIVE_WORK_COMPLETION_TOKENS = (
     "done",
     "finished",
 )
+ACTIVE_WORK_COMPLETION_RE = re.compile("|".join(map(re.escape, ACTIVE_WORK_COMPLETION_TOKENS)))
+# Checked in order: the first category with any keyword anywhere in the text wins, so
+# these stay separate patterns rather than one leftmost-match alternation.
+ACTIVITY_CATEGORY_PATTERNS: Tuple[Tuple[str, re.Pattern[str]], ...] = tuple(
+    (category, re.compile("|".join(map(re.escape, keywords))))
+    for category, keywords in (
+        ("ui", ("react", "typescript", "dashboard", "ui", "vite")),
+        ("reliability", ("watchdog", "reliability", "self-heal", "failover", "cron")),
+        ("release", ("release", "tag", "version", "changelog")),
+        ("docs", ("doc", "architecture", "readme", "agends.md", "agents.md")),
+    )
+)
+# Raw cron/subagent end statuses -> terminal event vocabulary; unknown values mean "finished".
+TERMINAL_STATUS_ALIASES: Dict[str, str] = {
+    "finished": "finished",
+    "ok": "finished",
+    "success": "finished",
+    "completed": "finished",
+    "done": "finished",
+    "cancelled": "cancelled",
+    "canceled": "cancelled",
+    "timeout": "timed_out",
+    "timedout": "timed_out",
+    "timed_out": "timed_out",
+    "failed": "failed",
+    "error": "failed",
+    "errored": "failed",
+}
+STATUS_SCORES: Dict[str, float] = {
+    "ok": 1.0,
+    "green": 1.0,
+    "success": 1.0,
+    "yellow": 0.55,
+    "warn": 0.55,
+    "warning": 0.55,
+    "error": 0.0,
+    "red": 0.0,
+    "failed": 0.0,
+}
+STATUS_SCORE_DEFAULT = 0.35
 WORKSTREAM_DONE_MAX_AGE_MINUTES = 6 * 60
 WORKSTREAM_NEXT_JOB_HORIZON_MINUTES = 2 * 60
 WORKSTREAM_NEXT_JOB_PRIORITY_WINDOW_MINUTES = 90
@@ -84,7 +163,18 @@ WORKSTREAM_DONE_PROOF_PREFIXES = (
 EXCLUDED_RUNTIME_JOB_NAME_SUBSTRINGS = (
     "control room status publish",
 )
+EXCLUDED_RUNTIME_JOB_NAME_RE = re.compile("|".join(map(re.escape, EXCLUDED_RUNTIME_JOB_NAME_SUBSTRINGS)))
 WORKSTREAM_STATE_FILE = Path("/Users/seankudrna/.openclaw/workspace/status/control-room-workstream-state.json")
+# In-process watchdog report builders keyed by script path -> (st_mtime_ns, builder).
+_RELIABILITY_REPORT_BUILDERS: Dict[Path, Tuple[int, Optional[Callable[..., Any]]]] = {}
+# Watchdog status keyed by (script path, window hours) -> ((st_mtime_ns, st_size), monotonic ts, status).
+_RELIABILITY_STATUS_CACHE: Dict[Tuple[Path, float], Tuple[Tuple[int, int], float, Dict[str, str]]] = {}
+# Parsed JSON docs keyed by path -> ((st_mtime_ns, st_size), doc); see `load_json_doc`.
+_JSON_DOC_CACHE: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+# Runtime job lookup keyed by jobs path -> (parsed doc it was built from, index).
+_RUNTIME_JOBS_INDEX_CACHE: Dict[Path, Tuple[Any, Dict[str, Dict[str, Optional[str]]]]] = {}
+# Cron terminal events keyed by run file -> ((st_mtime_ns, st_size), events).
+_CRON_TERMINAL_EVENTS_CACHE: Dict[Path, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
 CLAWPRIME_MEMORY_FILE = "ClawPrime_Memory.md"
 SKILL_KEYWORDS: Dict[str, Tuple[str, ...]] = {
     "runtime-orchestration": ("runtime", "orchestration", "scheduler", "cron", "subagent", "queue"),
@@ -173,74 +263,158 @@ SKILL_TIER_FRAMEWORK: List[Dict[str, Any]] = [
 ]
 
 SKILL_MAX_TIER = 5
+# Keyword hits at which skill progress saturates at 1.0.
+SKILL_PROGRESS_FULL_HITS = 8
 
 WORKSTREAM_RUNTIME_NOW_LIMIT = 1
 WORKSTREAM_NEXT_LIMIT = 5
 WORKSTREAM_DONE_LIMIT = 5
-DONE_LANE_TIME_RANGE_PREFIX_RE = re.compile(r"^\s*(\d{1,2}:\d{2})-(\d{1,2}:\d{2})\s*[—\-:]\s*(.+)$")
-DONE_LANE_TIME_PREFIX_RE = re.compile(r"^\s*(\d{1,2}:\d{2})\s*[—\-:]\s*(.+)$")
+# Optional second time: when group 2 matches the range end is the completion time.
+DONE_LANE_TIME_PREFIX_RE = re.compile(r"^\s*(\d{1,2}:\d{2})(?:-(\d{1,2}:\d{2}))?\s*[—\-:]\s*(.+)$")
 
 
 def read_text(path: Path) -> str:
-    """Return file text or empty string when missing."""
-    return path.read_text(encoding="utf-8") if path.exists() else ""
+    """Return file text or empty string when missing.
+
+    Opens in binary mode and decodes once; a missing file is detected by the open
+    itself rather than a separate `exists()` stat.
+    """
+    try:
+        with open(path, "rb") as handle:
+            return handle.read().decode("utf-8")
+    except (FileNotFoundError, NotADirectoryError):
+        return ""
+
+
+def read_tail_lines(path: Path, max_lines: int, block_size: int = 64 * 1024) -> List[bytes]:
+    """Return up to the last `max_lines` lines of `path` as raw bytes.
+
+    Reads backwards from EOF in `block_size` chunks, so cost tracks the tail size rather
+    than the file size. Raises `FileNotFoundError`/`NotADirectoryError` like `open`.
+    """
+    if max_lines <= 0:
+        return []
+
+    chunks: List[bytes] = []
+    newlines = 0
+    with open(path, "rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        while position > 0 and newlines <= max_lines:
+            step = min(block_size, position)
+            position -= step
+            handle.seek(position)
+            chunk = handle.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+
+    lines = b"".join(reversed(chunks)).splitlines()
+    if position > 0:
+        # The first line may start mid-row; enough complete lines were read past it.
+        lines = lines[1:]
+    return lines[-max_lines:]
+
+
+def load_json_doc(path: Path) -> Any:
+    """Return the parsed JSON doc at `path`, or None when missing/invalid.
+
+    Parses are reused while the file's `(st_mtime_ns, st_size)` is unchanged, so the
+    jobs file is decoded once per build instead of once per reader. Callers must treat
+    the returned doc as read-only.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _JSON_DOC_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        doc = loads_json(path.read_bytes())
+    except (OSError, ValueError):
+        doc = None
+    _JSON_DOC_CACHE[path] = (signature, doc)
+    return doc
 
 
 def parse_daily_plan_blocks(plan_markdown: str) -> List[Dict[str, str]]:
-    """Extract timeline blocks from DAILY_PLAN markdown."""
-    timeline: List[Dict[str, str]] = []
-    for line in plan_markdown.splitlines():
-        match = BLOCK_RE.match(line.strip())
-        if not match:
-            continue
-        timeline.append({"time": f"{match.group(1)}-{match.group(2)}", "task": match.group(3)})
-    return timeline
+    """Extract timeline blocks from DAILY_PLAN markdown.
+
+    `str.find("###")` skips straight to candidate lines, and `PLAN_BLOCK_LINE_RE` is only
+    tried from the start of those; lines without `###` can never match it.
+    """
+    blocks: List[Dict[str, str]] = []
+    find = plan_markdown.find
+    position = find("###")
+    while position != -1:
+        line_start = plan_markdown.rfind("\n", 0, position) + 1
+        match = PLAN_BLOCK_LINE_RE.match(plan_markdown, line_start)
+        if match:
+            blocks.append({"time": f"{match.group(1)}-{match.group(2)}", "task": match.group(3)})
+
+        line_end = find("\n", position)
+        if line_end == -1:
+            break
+        position = find("###", line_end)
+    return blocks
 
 
 def parse_section_bullets(markdown: str, section_name: str) -> List[str]:
     """Return top-level bullet lines for a markdown `## <section_name>` section."""
-    in_section = False
+    wanted = section_name.strip().lower()
     bullets: List[str] = []
 
-    for raw in markdown.splitlines():
-        line = raw.strip()
-
-        heading_match = HEADING_RE.match(line)
-        if heading_match:
-            heading = heading_match.group(1).strip().lower()
-            in_section = heading == section_name.strip().lower()
+    # Scan headings only, then look for bullets just inside matching sections.
+    headings = list(SECTION_HEADING_LINE_RE.finditer(markdown))
+    for index, heading in enumerate(headings):
+        if heading.group(1).lower() != wanted:
             continue
+        section_end = headings[index + 1].start() if index + 1 < len(headings) else len(markdown)
+        bullets.extend(match.group(1) for match in SECTION_BULLET_LINE_RE.finditer(markdown, heading.end(), section_end))
 
-        if not in_section:
-            continue
+    return bullets
 
-        if line.startswith("## "):
-            break
 
-        if line.startswith("- "):
-            text = line[2:].strip()
-            if text:
-                bullets.append(text)
+def parse_today_status(today_status_markdown: str) -> Dict[str, str]:
+    """Extract primary focus and active work from TODAY_STATUS markdown.
 
-    return bullets
+    A single multiline regex scan replaces the per-line split + prefix checks; the
+    last matching bullet for each field wins, as before.
+    """
+    fields = {"Primary focus": "", "Running now": ""}
+    for match in TODAY_STATUS_FIELD_RE.finditer(today_status_markdown):
+        fields[match.group(1)] = match.group(2).strip()
 
+    return {"currentFocus": fields["Primary focus"], "activeWork": fields["Running now"]}
 
-def parse_today_status(today_status_markdown: str) -> Dict[str, str]:
-    """Extract primary focus and active work from TODAY_STATUS markdown."""
-    current_focus = ""
-    active_work = ""
 
-    for raw in today_status_markdown.splitlines():
-        line = raw.strip()
-        if line.startswith("- Primary focus:"):
-            current_focus = line.replace("- Primary focus:", "").strip()
-        elif line.startswith("- Running now:"):
-            active_work = line.replace("- Running now:", "").strip()
+def _scan_hhmm(text: str) -> Tuple[Optional[int], int]:
+    """Scan a leading `H:MM`/`HH:MM` token without regex.
+
+    Returns `(minutes, consumed_chars)`; minutes is None when the prefix is not a
+    valid 24-hour clock time.
+    """
+    if len(text) >= 4 and text[1] == ":":
+        hour_str, minute_str, consumed = text[:1], text[2:4], 4
+    elif len(text) >= 5 and text[2] == ":":
+        hour_str, minute_str, consumed = text[:2], text[3:5], 5
+    else:
+        return None, 0
+
+    if not (hour_str.isdecimal() and minute_str.isdecimal()):
+        return None, 0
 
-    return {"currentFocus": current_focus, "activeWork": active_work}
+    hour = int(hour_str)
+    minute = int(minute_str)
+    if hour > 23 or minute > 59:
+        return None, 0
+    return hour * 60 + minute, consumed
 
 
 def parse_hhmm_to_minutes(value: str) -> Optional[int]:
+    # Lenient on purpose (`9:5`, ` 09:05`); only leading-time scans need the strict form.
     try:
         hour_str, minute_str = value.split(":", 1)
         hour = int(hour_str)
@@ -253,7 +427,13 @@ def parse_hhmm_to_minutes(value: str) -> Optional[int]:
     return hour * 60 + minute
 
 
+@functools.lru_cache(maxsize=256)
 def parse_time_range(value: str) -> Optional[Tuple[int, int]]:
+    # Memoized: the same plan-block labels are parsed by timeline_context and
+    # timeline_events; results are immutable tuples so sharing is safe.
+    if ":" not in value:
+        # memchr-backed containment check rejects time-less text without a regex scan.
+        return None
     match = TIME_RANGE_RE.search(value)
     if not match:
         return None
@@ -266,10 +446,8 @@ def parse_time_range(value: str) -> Optional[Tuple[int, int]]:
 
 
 def parse_leading_time_minutes(value: str) -> Optional[int]:
-    match = HEADING_TIME_RE.match(value.strip())
-    if not match:
-        return None
-    return parse_hhmm_to_minutes(match.group(1))
+    minutes, _ = _scan_hhmm(value.strip())
+    return minutes
 
 
 def format_minutes_hhmm(minutes: int) -> str:
@@ -289,36 +467,32 @@ def format_done_lane_item(item: str) -> str:
     if not text:
         return text
 
-    range_match = DONE_LANE_TIME_RANGE_PREFIX_RE.match(text)
-    if range_match:
-        end_minutes = parse_hhmm_to_minutes(range_match.group(2))
-        if end_minutes is None:
-            return text
-        return f"{format_minutes_hhmm(end_minutes)} — {range_match.group(3).strip()}"
-
-    time_match = DONE_LANE_TIME_PREFIX_RE.match(text)
-    if time_match:
-        leading_minutes = parse_hhmm_to_minutes(time_match.group(1))
-        if leading_minutes is None:
-            return text
-        return f"{format_minutes_hhmm(leading_minutes)} — {time_match.group(2).strip()}"
+    match = DONE_LANE_TIME_PREFIX_RE.match(text)
+    if not match:
+        return text
 
-    return text
+    completed_minutes = parse_hhmm_to_minutes(match.group(2) or match.group(1))
+    if completed_minutes is None:
+        return text
+    return f"{format_minutes_hhmm(completed_minutes)} — {match.group(3).strip()}"
 
 
 def infer_time_anchor(item: str, now_local: dt.datetime) -> Optional[dt.datetime]:
     """Infer a local datetime anchor from a text item across common timestamp formats."""
     text = item.strip()
-    if not text:
+    if not text or ":" not in text:
+        # Every supported format carries an `HH:MM` clock part.
         return None
 
-    iso_match = re.search(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(?::\d{2})?(?:Z|[+-]\d{2}:?\d{2})?", text)
+    # Any ISO timestamp also matches DATED_TIME_RE at the same offset, so text without a
+    # dated match skips the ISO scan; when both exist the ISO parse still takes priority.
+    dated_match = DATED_TIME_RE.search(text)
+    iso_match = ISO_TIMESTAMP_RE.search(text) if dated_match else None
     if iso_match:
         parsed_ms = parse_timestamp_ms(iso_match.group(0))
         if parsed_ms is not None:
             return dt.datetime.fromtimestamp(parsed_ms / 1000, dt.timezone.utc).astimezone(now_local.tzinfo)
 
-    dated_match = re.search(r"(\d{4}-\d{2}-\d{2})[ T](\d{1,2}:\d{2})", text)
     if dated_match:
         try:
             parsed = dt.datetime.fromisoformat(f"{dated_match.group(1)} {dated_match.group(2)}")
@@ -354,7 +528,7 @@ def is_proof_scaffolding_line(item: str) -> bool:
         return True
 
     lower = stripped.lower().strip(":")
-    if any(lower.startswith(prefix) for prefix in WORKSTREAM_DONE_PROOF_PREFIXES):
+    if lower.startswith(WORKSTREAM_DONE_PROOF_PREFIXES):
         return True
 
     if stripped.startswith("`"):
@@ -363,40 +537,17 @@ def is_proof_scaffolding_line(item: str) -> bool:
     return False
 
 
-def normalize_semantic_text(value: str) -> str:
-    """Normalize text for semantic comparison by stripping time ranges and punctuation."""
-    cleaned = TIME_RANGE_RE.sub(" ", value)
-    tokens = WORD_RE.findall(cleaned.lower())
-    return " ".join(tokens)
-
-
-def semantic_tokens(value: str) -> set[str]:
-    """Return normalized semantic tokens, excluding stopwords."""
-    cleaned = TIME_RANGE_RE.sub(" ", value)
-    tokens = WORD_RE.findall(cleaned.lower())
-    return {token for token in tokens if token not in SEMANTIC_STOPWORDS}
-
-
-def semantic_similarity(tokens_a: set[str], tokens_b: set[str]) -> float:
-    if not tokens_a or not tokens_b:
-        return 0.0
-    intersection = len(tokens_a & tokens_b)
-    union = len(tokens_a | tokens_b)
-    return intersection / union if union else 0.0
-
-
-def token_overlap_ratio(tokens_a: set[str], tokens_b: set[str]) -> float:
-    if not tokens_a or not tokens_b:
-        return 0.0
-    overlap = len(tokens_a & tokens_b)
-    return overlap / min(len(tokens_a), len(tokens_b))
+def semantic_words(value: str) -> List[str]:
+    """Return lowercase word tokens with time ranges stripped (stopwords kept)."""
+    return WORD_RE.findall(TIME_RANGE_RE.sub(" ", value).lower())
 
 
-def has_meaningful_token_overlap(tokens_a: set[str], tokens_b: set[str]) -> bool:
+def has_meaningful_token_overlap(tokens_a: AbstractSet[str], tokens_b: AbstractSet[str]) -> bool:
     overlap = len(tokens_a & tokens_b)
     if overlap < NEXT_LANE_DEDUPE_MIN_TOKEN_OVERLAP:
         return False
-    return token_overlap_ratio(tokens_a, tokens_b) >= NEXT_LANE_DEDUPE_OVERLAP_RATIO_THRESHOLD
+    # Overlap relative to the smaller token set, reusing the intersection count above.
+    return overlap / min(len(tokens_a), len(tokens_b)) >= NEXT_LANE_DEDUPE_OVERLAP_RATIO_THRESHOLD
 
 
 def time_ranges_overlap_or_close(
@@ -408,52 +559,69 @@ def time_ranges_overlap_or_close(
     return range_a[0] <= range_b[1] + grace_minutes and range_b[0] <= range_a[1] + grace_minutes
 
 
-def build_next_lane_meta(item: str) -> Dict[str, Any]:
-    return {
-        "text": item,
-        "range": parse_time_range(item),
-        "normalized": normalize_semantic_text(item),
-        "tokens": semantic_tokens(item),
-    }
+class NextLaneMeta(NamedTuple):
+    """Precomputed comparison fields for one next-lane item (attribute access in dedupe loops)."""
+
+    text: str
+    range: Optional[Tuple[int, int]]
+    normalized: str
+    tokens: frozenset[str]
+
+
+@functools.lru_cache(maxsize=512)
+def build_next_lane_meta(item: str) -> NextLaneMeta:
+    # Memoized: the same plan/status lines recur within a build and across builds; the
+    # meta is an immutable NamedTuple of str/tuple/frozenset, so sharing is safe.
+    # One substitution + tokenization pass feeds both the normalized text and token set.
+    words = semantic_words(item)
+    return NextLaneMeta(
+        text=item,
+        range=parse_time_range(item),
+        normalized=" ".join(words),
+        tokens=frozenset(token for token in words if token not in SEMANTIC_STOPWORDS),
+    )
 
 
 def is_semantic_match(
-    candidate: Dict[str, Any],
-    existing: Dict[str, Any],
+    candidate: NextLaneMeta,
+    existing: NextLaneMeta,
     threshold: float,
 ) -> bool:
-    if candidate["normalized"] and candidate["normalized"] == existing["normalized"]:
+    if candidate.normalized and candidate.normalized == existing.normalized:
         return True
 
-    tokens_a = candidate["tokens"]
-    tokens_b = existing["tokens"]
-    if len(tokens_a) < 2 or len(tokens_b) < 2:
+    tokens_a = candidate.tokens
+    tokens_b = existing.tokens
+    size_a = len(tokens_a)
+    size_b = len(tokens_b)
+    if size_a < 2 or size_b < 2:
         return False
 
-    similarity = semantic_similarity(tokens_a, tokens_b)
-    if similarity >= threshold:
+    # One intersection count drives both the Jaccard score and the subset check
+    # (A ⊆ B exactly when |A ∩ B| == |A|).
+    shared = len(tokens_a & tokens_b)
+    if shared / (size_a + size_b - shared) >= threshold:
         return True
 
-    overlap = tokens_a & tokens_b
-    if len(overlap) >= NEXT_LANE_DEDUPE_MIN_TOKEN_OVERLAP:
-        return tokens_a.issubset(tokens_b) or tokens_b.issubset(tokens_a)
+    if shared >= NEXT_LANE_DEDUPE_MIN_TOKEN_OVERLAP:
+        return shared == size_a or shared == size_b
     return False
 
 
-def is_duplicate_next_item(candidate: Dict[str, Any], existing_items: List[Dict[str, Any]]) -> bool:
+def is_duplicate_next_item(candidate: NextLaneMeta, existing_items: List[NextLaneMeta]) -> bool:
     """Return True when candidate duplicates any canonical next item."""
     for existing in existing_items:
-        if candidate["normalized"] and candidate["normalized"] == existing["normalized"]:
+        if candidate.normalized and candidate.normalized == existing.normalized:
             return True
 
-        range_a = candidate.get("range")
-        range_b = existing.get("range")
+        range_a = candidate.range
+        range_b = existing.range
         if range_a and range_b:
             if not time_ranges_overlap_or_close(range_a, range_b):
                 continue
             if is_semantic_match(candidate, existing, NEXT_LANE_DEDUPE_SIMILARITY_THRESHOLD):
                 return True
-            if has_meaningful_token_overlap(candidate["tokens"], existing["tokens"]):
+            if has_meaningful_token_overlap(candidate.tokens, existing.tokens):
                 return True
             continue
 
@@ -464,35 +632,46 @@ def is_duplicate_next_item(candidate: Dict[str, Any], existing_items: List[Dict[
 
 
 def dedupe_next_lane(timeline_items: List[str], status_items: List[str]) -> List[str]:
-    """Return next-lane items with timeline entries canonicalized."""
-    canonical_meta = [build_next_lane_meta(item) for item in timeline_items]
+    """Return next-lane items with timeline entries canonicalized.
+
+    Every non-exact duplicate rule needs at least two shared tokens, so an inverted
+    token index limits full comparisons to seen items sharing a token with the
+    candidate; exact normalized matches short-circuit via a set lookup.
+    """
     deduped = list(timeline_items)
-    seen_meta = list(canonical_meta)
+    seen_meta: List[NextLaneMeta] = []
+    seen_normalized: set[str] = set()
+    token_index: Dict[str, List[int]] = {}
+
+    def remember(meta: NextLaneMeta) -> None:
+        position = len(seen_meta)
+        seen_meta.append(meta)
+        if meta.normalized:
+            seen_normalized.add(meta.normalized)
+        for token in meta.tokens:
+            token_index.setdefault(token, []).append(position)
+
+    for item in timeline_items:
+        remember(build_next_lane_meta(item))
 
     for item in status_items:
         meta = build_next_lane_meta(item)
-        if is_duplicate_next_item(meta, seen_meta):
+        if meta.normalized and meta.normalized in seen_normalized:
+            continue
+        positions = sorted({position for token in meta.tokens for position in token_index.get(token, ())})
+        if is_duplicate_next_item(meta, [seen_meta[position] for position in positions]):
             continue
         deduped.append(item)
-        seen_meta.append(meta)
+        remember(meta)
 
     return deduped
 
 
 def normalize_items(items: List[str], limit: int) -> List[str]:
-    seen: set[str] = set()
-    out: List[str] = []
-    for item in items:
-        text = item.strip()
-        if not text:
-            continue
-        if text in seen:
-            continue
-        seen.add(text)
-        out.append(text)
-        if len(out) >= limit:
-            break
-    return out
+    """Strip, drop blanks and de-duplicate `items` (first occurrence wins), capped at `limit`."""
+    # dict.fromkeys dedupes at C speed while keeping insertion order.
+    deduped = dict.fromkeys(text for text in map(str.strip, items) if text)
+    return list(itertools.islice(deduped, limit))
 
 
 def format_block(block: Dict[str, str]) -> str:
@@ -500,35 +679,32 @@ def format_block(block: Dict[str, str]) -> str:
 
 
 def timeline_context(timeline: List[Dict[str, str]], now_local: dt.datetime) -> Dict[str, Any]:
-    """Return timeline slices around `now_local` (current, next, completed)."""
+    """Return timeline slices around `now_local` (current, next, completed).
+
+    Slices keep DAILY_PLAN order and the last listed in-progress block wins, so this
+    stays a single linear pass rather than a sort + bisect partition.
+    """
     now_minutes = now_local.hour * 60 + now_local.minute
 
     normalized: List[Dict[str, Any]] = []
+    current: Optional[Dict[str, Any]] = None
+    next_blocks: List[Dict[str, Any]] = []
+    completed: List[Dict[str, Any]] = []
+
     for block in timeline:
         block_time = block.get("time", "")
         parsed = parse_time_range(block_time)
         if parsed is None:
             continue
-        normalized.append(
-            {
-                "time": block_time,
-                "task": block.get("task", ""),
-                "start": parsed[0],
-                "end": parsed[1],
-            }
-        )
-
-    current: Optional[Dict[str, Any]] = None
-    next_blocks: List[Dict[str, Any]] = []
-    completed: List[Dict[str, Any]] = []
-
-    for block in normalized:
-        if block["start"] <= now_minutes < block["end"]:
-            current = block
-        elif now_minutes < block["start"]:
-            next_blocks.append(block)
-        elif block["end"] <= now_minutes:
-            completed.append(block)
+        start, end = parsed
+        entry = {"time": block_time, "task": block.get("task", ""), "start": start, "end": end}
+        normalized.append(entry)
+        if start <= now_minutes < end:
+            current = entry
+        elif now_minutes < start:
+            next_blocks.append(entry)
+        elif end <= now_minutes:
+            completed.append(entry)
 
     if current is None and not next_blocks and normalized:
         # Past the final planned block for the day.
@@ -548,7 +724,7 @@ def is_stale_active_work(active_work: str, now_local: dt.datetime, grace_minutes
 
     now_minutes = now_local.hour * 60 + now_local.minute
     lowered = text.lower()
-    has_completion_token = any(token in lowered for token in ACTIVE_WORK_COMPLETION_TOKENS)
+    has_completion_token = ACTIVE_WORK_COMPLETION_RE.search(lowered) is not None
 
     parsed = parse_time_range(text)
     if parsed is not None:
@@ -577,13 +753,17 @@ def resolve_active_work(
     raw_active_work: str,
     timeline: List[Dict[str, str]],
     now_local: dt.datetime,
+    context: Optional[Dict[str, Any]] = None,
 ) -> str:
-    """Resolve active work with stale guard + timeline fallback."""
-    context = timeline_context(timeline, now_local)
+    """Resolve active work with stale guard + timeline fallback.
 
+    `context` may carry a precomputed `timeline_context(timeline, now_local)` result.
+    """
     if raw_active_work and not is_stale_active_work(raw_active_work, now_local):
         return raw_active_work
 
+    if context is None:
+        context = timeline_context(timeline, now_local)
     current = context.get("current")
     if current:
         return format_block(current)
@@ -595,13 +775,20 @@ def resolve_active_work(
     return raw_active_work
 
 
-def resolve_current_focus(raw_focus: str, active_work: str, timeline: List[Dict[str, str]], now_local: dt.datetime) -> str:
+def resolve_current_focus(
+    raw_focus: str,
+    active_work: str,
+    timeline: List[Dict[str, str]],
+    now_local: dt.datetime,
+    context: Optional[Dict[str, Any]] = None,
+) -> str:
     """Resolve current focus with robust fallbacks when TODAY_STATUS is stale/incomplete."""
     normalized_focus = raw_focus.strip()
     if normalized_focus and normalized_focus.lower() not in {"n/a", "na", "none", "unknown"}:
         return normalized_focus
 
-    context = timeline_context(timeline, now_local)
+    if context is None:
+        context = timeline_context(timeline, now_local)
     current = context.get("current")
     if current and current.get("task"):
         return current["task"]
@@ -638,10 +825,19 @@ def is_future_timed_item(item: str, now_local: dt.datetime) -> bool:
     return single_time > now_minutes
 
 
+# Unified events always carry `startMs` and `id`; order by start time, then id.
+event_order_key = itemgetter("startMs", "id")
+
+
 def timeline_events(timeline: List[Dict[str, str]], now_local: dt.datetime) -> List[Dict[str, Any]]:
     """Return timeline blocks that have not yet completed as unified events."""
     day_start = now_local.replace(hour=0, minute=0, second=0, microsecond=0)
+    id_prefix = f"timeline:{day_start.strftime('%Y-%m-%d')}:"
     now_ms = int(now_local.timestamp() * 1000)
+    day_start_ms = int(day_start.timestamp() * 1000)
+    # Wall-clock minutes map linearly onto epoch ms unless today has a DST transition;
+    # only then fall back to per-block datetime arithmetic.
+    uniform_day = int((day_start + dt.timedelta(days=1)).timestamp() * 1000) - day_start_ms == 86_400_000
     events: List[Dict[str, Any]] = []
 
     for block in timeline:
@@ -649,15 +845,17 @@ def timeline_events(timeline: List[Dict[str, str]], now_local: dt.datetime) -> L
         if parsed is None:
             continue
         start_minutes, end_minutes = parsed
-        start_dt = day_start + dt.timedelta(minutes=start_minutes)
-        end_dt = day_start + dt.timedelta(minutes=end_minutes)
-        start_ms = int(start_dt.timestamp() * 1000)
-        end_ms = int(end_dt.timestamp() * 1000)
+        if uniform_day:
+            start_ms = day_start_ms + start_minutes * 60_000
+            end_ms = day_start_ms + end_minutes * 60_000
+        else:
+            start_ms = int((day_start + dt.timedelta(minutes=start_minutes)).timestamp() * 1000)
+            end_ms = int((day_start + dt.timedelta(minutes=end_minutes)).timestamp() * 1000)
         if end_ms <= now_ms:
             continue
         task = (block.get("task") or "").strip()
         time_label = block.get("time", "n/a")
-        event_id = f"timeline:{start_dt.strftime('%Y-%m-%d')}:{time_label}:{task.lower()}"
+        event_id = f"{id_prefix}{time_label}:{task.lower()}"
         events.append(
             {
                 "id": event_id,
@@ -668,19 +866,14 @@ def timeline_events(timeline: List[Dict[str, str]], now_local: dt.datetime) -> L
             }
         )
 
-    events.sort(key=lambda item: (item.get("startMs", 0), item.get("id", "")))
+    events.sort(key=event_order_key)
     return events
 
 
 def scheduled_job_events(jobs_file: Path, now_local: dt.datetime) -> List[Dict[str, Any]]:
     """Return future scheduled cron runs as unified events."""
-    content = read_text(jobs_file)
-    if not content:
-        return []
-
-    try:
-        doc = json.loads(content)
-    except json.JSONDecodeError:
+    doc = load_json_doc(jobs_file)
+    if not doc:
         return []
 
     now_ms = int(now_local.astimezone(dt.timezone.utc).timestamp() * 1000)
@@ -704,7 +897,7 @@ def scheduled_job_events(jobs_file: Path, now_local: dt.datetime) -> List[Dict[s
             }
         )
 
-    events.sort(key=lambda item: (item.get("startMs", 0), item.get("id", "")))
+    events.sort(key=event_order_key)
     return events
 
 
@@ -732,21 +925,14 @@ def runtime_events(runtime: Dict[str, Any]) -> List[Dict[str, Any]]:
             }
         )
 
-    events.sort(key=lambda item: (item.get("startMs", 0), item.get("id", "")))
+    events.sort(key=event_order_key)
     return events
 
 
 def load_workstream_state(state_path: Path, now_local: dt.datetime) -> Dict[str, Any]:
     today = now_local.strftime("%Y-%m-%d")
     default = {"day": today, "seenNow": [], "done": [], "labels": {}}
-    if not state_path.exists():
-        return default
-
-    try:
-        doc = json.loads(state_path.read_text(encoding="utf-8"))
-    except Exception:
-        return default
-
+    doc = load_json_doc(state_path)
     if not isinstance(doc, dict) or doc.get("day") != today:
         return default
 
@@ -758,12 +944,18 @@ def load_workstream_state(state_path: Path, now_local: dt.datetime) -> Dict[str,
         for key, value in labels_doc.items()
         if isinstance(labels_doc, dict) and isinstance(key, str) and isinstance(value, str)
     }
+    # Fresh containers every call, so callers never mutate the cached doc.
     return {"day": today, "seenNow": seen_now, "done": done, "labels": labels}
 
 
 def save_workstream_state(state_path: Path, state: Dict[str, Any]) -> None:
     state_path.parent.mkdir(parents=True, exist_ok=True)
-    state_path.write_text(json.dumps(state, indent=2) + "\n", encoding="utf-8")
+    write_json(state_path, state)
+    # Prime the parse cache with a container-level copy so later caller mutations of
+    # `state` cannot leak into the next load.
+    stat = state_path.stat()
+    snapshot = {key: value.copy() if isinstance(value, (dict, list)) else value for key, value in state.items()}
+    _JSON_DOC_CACHE[state_path] = ((stat.st_mtime_ns, stat.st_size), snapshot)
 
 
 def build_workstream_lanes(
@@ -774,8 +966,10 @@ def build_workstream_lanes(
     state_path: Path,
 ) -> Dict[str, List[str]]:
     """Build deterministic now/next/done lanes from unified event model."""
-    future_events = timeline_events(timeline, now_local) + scheduled_job_events(jobs_file, now_local)
-    future_events.sort(key=lambda item: (item.get("startMs", 0), item.get("id", "")))
+    # Both helpers return lists already ordered by `event_order_key`; merge instead of re-sorting.
+    future_events = list(
+        heapq.merge(timeline_events(timeline, now_local), scheduled_job_events(jobs_file, now_local), key=event_order_key)
+    )
     active_events = runtime_events(runtime)
 
     state = load_workstream_state(state_path, now_local)
@@ -821,11 +1015,13 @@ def build_workstream_lanes(
 
     active_labels = set(output["now"])
     next_unique = [item for item in output["next"] if item not in active_labels]
-    done_unique = [item for item in output["done"] if item not in active_labels and item not in set(next_unique)]
+    shown_labels = active_labels.union(next_unique)
+    done_unique = [item for item in output["done"] if item not in shown_labels]
     output["next"] = next_unique
     output["done"] = done_unique
 
-    persisted_done_ids = [event_id for event_id in done_ids if labels.get(event_id) in output["done"]]
+    done_label_set = set(done_unique)
+    persisted_done_ids = [event_id for event_id in done_ids if labels.get(event_id) in done_label_set]
     output["done"] = [format_done_lane_item(item) for item in output["done"]]
     new_state = {
         "day": now_local.strftime("%Y-%m-%d"),
@@ -860,50 +1056,138 @@ def parse_workstream(
     )
 
 
-def reliability_status(workspace_root: Path, window_hours: float = 8.0) -> Dict[str, str]:
+def supports_in_process_report(source: str) -> bool:
+    """Return True when watchdog `source` opts into in-process `build_report` calls.
+
+    Requires a top-level `RELIABILITY_REPORT_IN_PROCESS_MARKER = True` assignment and a
+    top-level `def build_report(...)`, both read from the AST without executing code.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return False
+
+    has_marker = False
+    has_entrypoint = False
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == RELIABILITY_REPORT_ENTRYPOINT:
+            has_entrypoint = True
+        elif (
+            isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Constant)
+            and node.value.value is True
+            and any(isinstance(target, ast.Name) and target.id == RELIABILITY_REPORT_IN_PROCESS_MARKER for target in node.targets)
+        ):
+            has_marker = True
+    return has_marker and has_entrypoint
+
+
+def load_reliability_report_builder(script: Path) -> Optional[Callable[..., Any]]:
+    """Import the watchdog script in-process and return its `build_report`, if exposed.
+
+    The script is only imported when `supports_in_process_report` finds the explicit
+    opt-in marker plus a top-level `build_report(window_hours=...)` (returning the same
+    dict as `--json`), so CLI-only scripts never run top-level code here.
+    """
+    try:
+        mtime_ns = script.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    cached = _RELIABILITY_REPORT_BUILDERS.get(script)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    builder: Optional[Callable[..., Any]] = None
+    if supports_in_process_report(read_text(script)):
+        try:
+            spec = importlib.util.spec_from_file_location("_control_room_reliability_report", script)
+            if spec is not None and spec.loader is not None:
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                candidate = getattr(module, RELIABILITY_REPORT_ENTRYPOINT, None)
+                builder = candidate if callable(candidate) else None
+        except (Exception, SystemExit):
+            builder = None
+
+    _RELIABILITY_REPORT_BUILDERS[script] = (mtime_ns, builder)
+    return builder
+
+
+def run_reliability_report(script: Path, window_hours: float) -> Dict[str, Any]:
+    """Return the watchdog JSON report, in-process when possible, else via subprocess."""
+    builder = load_reliability_report_builder(script)
+    if builder is not None:
+        try:
+            report = builder(window_hours=window_hours)
+            if isinstance(report, dict):
+                return report
+        except (Exception, SystemExit):
+            # A builder that exits (sys.exit / argparse.error) must not end the status build.
+            pass
+
+    output = subprocess.check_output(
+        ["python3", str(script), "--window-hours", str(window_hours), "--json"],
+        timeout=30,
+    )
+    return loads_json(output)
+
+
+def reliability_status(
+    workspace_root: Path,
+    window_hours: float = 8.0,
+    cache_ttl_seconds: float = RELIABILITY_CACHE_TTL_SECONDS,
+) -> Dict[str, str]:
     """Query watchdog report script for health status.
 
+    Successful reports are kept in memory for `cache_ttl_seconds`, keyed by the script's
+    (st_mtime_ns, st_size) signature, so frequent status builds skip the report entirely;
+    editing the script or passing `cache_ttl_seconds=0` forces a fresh report. Scripts
+    exposing `build_report` run in-process; others still go through a
+    `python3 ... --json` subprocess.
+
     Returns a compact shape for dashboard consumption.
     """
     script = workspace_root / "scripts" / "reliability_watchdog_report.py"
-    if not script.exists():
+    try:
+        stat = script.stat()
+    except OSError:
         return {"status": "unknown"}
 
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cache_key = (script, window_hours)
+    cached = _RELIABILITY_STATUS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature and time.monotonic() - cached[1] < cache_ttl_seconds:
+        return dict(cached[2])
+
     try:
-        output = subprocess.check_output(
-            ["python3", str(script), "--window-hours", str(window_hours), "--json"],
-            text=True,
-            timeout=30,
-        )
-        report = json.loads(output)
-        return {"status": report.get("health", {}).get("status", "unknown")}
+        report = run_reliability_report(script, window_hours)
+        status_block = {"status": report.get("health", {}).get("status", "unknown")}
     except Exception:
         return {"status": "unknown"}
 
+    _RELIABILITY_STATUS_CACHE[cache_key] = (signature, time.monotonic(), status_block)
+    return dict(status_block)
+
 
 def next_jobs(jobs_file: Path, limit: int = 8) -> List[Dict[str, Any]]:
     """Return the next enabled jobs sorted by next run timestamp."""
-    content = read_text(jobs_file)
-    if not content:
+    doc = load_json_doc(jobs_file)
+    if not doc:
         return []
 
-    try:
-        doc = json.loads(content)
-    except json.JSONDecodeError:
-        return []
-
-    jobs = [job for job in doc.get("jobs", []) if job.get("enabled")]
-    jobs.sort(key=lambda job: job.get("state", {}).get("nextRunAtMs") or 2**63)
+    # Bounded top-k selection: equivalent to a stable sort + slice without ordering every job.
+    jobs = heapq.nsmallest(
+        limit,
+        (job for job in doc.get("jobs", []) if job.get("enabled")),
+        key=lambda job: job.get("state", {}).get("nextRunAtMs") or 2**63,
+    )
 
     out: List[Dict[str, Any]] = []
-    for job in jobs[:limit]:
+    for job in jobs:
         next_run_ms = job.get("state", {}).get("nextRunAtMs")
         if isinstance(next_run_ms, int):
-            next_run = (
-                dt.datetime.fromtimestamp(next_run_ms / 1000, dt.timezone.utc)
-                .astimezone()
-                .strftime("%H:%M")
-            )
+            next_run = format_local_timestamp(next_run_ms, "%H:%M")
         else:
             next_run = "n/a"
 
@@ -925,13 +1209,8 @@ def near_term_job_markers(
     limit: int = 3,
 ) -> List[str]:
     """Return near-term scheduled jobs as next-lane candidates."""
-    content = read_text(jobs_file)
-    if not content:
-        return []
-
-    try:
-        doc = json.loads(content)
-    except json.JSONDecodeError:
+    doc = load_json_doc(jobs_file)
+    if not doc:
         return []
 
     now_utc = now_local.astimezone(dt.timezone.utc)
@@ -957,62 +1236,65 @@ def near_term_job_markers(
             continue
         candidates.append((next_run_ms, f"{local_label} — Scheduled job: {name}"))
 
-    candidates.sort(key=lambda pair: pair[0])
-    return [text for _, text in candidates[:limit]]
+    return [text for _, text in heapq.nsmallest(limit, candidates, key=itemgetter(0))]
 
 
 def recent_findings(memory_markdown: str, limit: int = 6) -> List[str]:
-    """Take the last bullet-like memory lines as concise findings."""
-    bullets = [line.strip() for line in memory_markdown.splitlines() if line.strip().startswith("-")]
-    return [line.lstrip("- ") for line in bullets[-limit:]]
+    """Take the last bullet-like memory lines as concise findings.
+
+    Walks lines backwards from the end of the document (via `rfind`) and stops as soon
+    as `limit` bullets are found, so long memory files are not split or stripped in full.
+    """
+    found: List[str] = []
+    end = len(memory_markdown)
+    while end > 0 and len(found) < limit:
+        start = memory_markdown.rfind("\n", 0, end) + 1
+        # splitlines() on the segment keeps any non-"\n" separators behaving as before.
+        for raw in reversed(memory_markdown[start:end].splitlines()):
+            line = raw.strip()
+            if line.startswith("-"):
+                found.append(line.lstrip("- "))
+                if len(found) == limit:
+                    break
+        end = start - 1
+    found.reverse()
+    return found
 
 
 def infer_activity_category(text: str) -> str:
     lowered = text.lower()
-    if any(word in lowered for word in ["react", "typescript", "dashboard", "ui", "vite"]):
-        return "ui"
-    if any(word in lowered for word in ["watchdog", "reliability", "self-heal", "failover", "cron"]):
-        return "reliability"
-    if any(word in lowered for word in ["release", "tag", "version", "changelog"]):
-        return "release"
-    if any(word in lowered for word in ["doc", "architecture", "readme", "agends.md", "agents.md"]):
-        return "docs"
+    for category, pattern in ACTIVITY_CATEGORY_PATTERNS:
+        if pattern.search(lowered):
+            return category
     return "ops"
 
 
 def recent_activity(memory_markdown: str, limit: int = 24) -> List[Dict[str, str]]:
     """Build a lightweight activity feed from today's memory bullets."""
-    activities: List[Dict[str, str]] = []
+    # Keep only the last `limit` (heading, time, text) triples; categories and dicts are
+    # built for the survivors instead of every bullet in the file.
+    recent: deque[Tuple[str, str, str]] = deque(maxlen=limit)
     current_heading = ""
     current_time = ""
 
-    for raw in memory_markdown.splitlines():
-        line = raw.strip()
-
-        if line.startswith("## "):
-            current_heading = line[3:].strip()
-            match = HEADING_TIME_RE.match(current_heading)
-            current_time = match.group(1) if match else ""
+    # Only heading/bullet lines are visited; every other line is skipped by the regex engine.
+    for match in ACTIVITY_LINE_RE.finditer(memory_markdown):
+        if match.group(1) is not None:
+            current_heading = match.group(2)
+            time_match = HEADING_TIME_RE.match(current_heading)
+            current_time = time_match.group(1) if time_match else ""
             continue
 
-        if not line.startswith("- "):
-            continue
-
-        text = line[2:].strip()
-        if not text:
-            continue
-
-        category = infer_activity_category(f"{current_heading} {text}")
-        activities.append(
-            {
-                "time": current_time or "n/a",
-                "category": category,
-                "text": text,
-            }
-        )
-
-    return activities[-limit:]
+        recent.append((current_heading, current_time, match.group(2)))
 
+    return [
+        {
+            "time": time_label or "n/a",
+            "category": infer_activity_category(f"{heading} {text}"),
+            "text": text,
+        }
+        for heading, time_label, text in recent
+    ]
 
 
 def build_skill_tier_ladder(spec: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -1036,45 +1318,59 @@ def build_skill_tier_ladder(spec: Dict[str, Any]) -> List[Dict[str, Any]]:
 
 
 def gather_skill_artifacts(workspace_root: Path, now_local: dt.datetime) -> List[Tuple[str, str]]:
-    artifacts: List[Tuple[str, str]] = []
+    """Return `(path, raw text)` for the last 7 daily memory files plus ClawPrime memory."""
     memory_root = workspace_root / "memory"
-    for offset in range(0, 7):
-        target = now_local - dt.timedelta(days=offset)
-        path = memory_root / f"{target.strftime('%Y-%m-%d')}.md"
+    paths = [memory_root / f"{(now_local - dt.timedelta(days=offset)).strftime('%Y-%m-%d')}.md" for offset in range(0, 7)]
+    paths.append(workspace_root / CLAWPRIME_MEMORY_FILE)
+
+    artifacts: List[Tuple[str, str]] = []
+    for path in paths:
         text = read_text(path)
         if text:
-            artifacts.append((str(path), text.lower()))
-
-    clawprime_path = workspace_root / CLAWPRIME_MEMORY_FILE
-    clawprime_text = read_text(clawprime_path)
-    if clawprime_text:
-        artifacts.append((str(clawprime_path), clawprime_text.lower()))
+            artifacts.append((str(path), text))
     return artifacts
 
 
+def count_keyword_hits(text: str, keywords: Tuple[str, ...], cap: int) -> int:
+    """Count non-overlapping keyword occurrences (as `str.count` does), stopping at `cap`.
+
+    Progress saturates at `cap` hits, so frequent keywords stop after a few `find`
+    calls instead of scanning the whole corpus once per keyword.
+    """
+    hits = 0
+    for keyword in keywords:
+        position = text.find(keyword)
+        while position != -1:
+            hits += 1
+            if hits >= cap:
+                return hits
+            position = text.find(keyword, position + len(keyword))
+    return hits
+
+
 def build_skills_payload(workspace_root: Path, now_local: dt.datetime) -> Dict[str, Any]:
     artifacts = gather_skill_artifacts(workspace_root, now_local)
-    weighted_text = "\n".join(text for _, text in artifacts)
+    # One lower() over the joined corpus instead of one per artifact.
+    weighted_text = "\n".join(text for _, text in artifacts).lower()
     artifact_sources = [path for path, _ in artifacts]
 
     skill_nodes: List[Dict[str, Any]] = []
+    # Ids of earlier catalog entries that resolved to "active" (deps only look backwards).
+    active_ids: set[str] = set()
     active_count = 0
     planned_count = 0
     locked_count = 0
 
     for graph_tier, spec in enumerate(SKILL_CATALOG, start=1):
         skill_id = spec["id"]
-        hits = 0
-        for keyword in SKILL_KEYWORDS.get(skill_id, ()): 
-            hits += weighted_text.count(keyword)
-
-        progress = max(0.0, min(1.0, hits / 8.0))
+        hits = count_keyword_hits(weighted_text, SKILL_KEYWORDS.get(skill_id, ()), SKILL_PROGRESS_FULL_HITS)
+        progress = max(0.0, min(1.0, hits / float(SKILL_PROGRESS_FULL_HITS)))
         inferred_tier = max(0, min(SKILL_MAX_TIER, int(progress * SKILL_MAX_TIER)))
         if progress > 0 and inferred_tier == 0:
             inferred_tier = 1
 
         deps = spec.get("dependencies", [])
-        deps_met = all(any(node.get("id") == dep and node.get("state") == "active" for node in skill_nodes) for dep in deps)
+        deps_met = all(dep in active_ids for dep in deps)
 
         current_tier = inferred_tier if deps_met else 0
         next_tier = current_tier + 1 if current_tier < SKILL_MAX_TIER else None
@@ -1088,6 +1384,7 @@ def build_skills_payload(workspace_root: Path, now_local: dt.datetime) -> Dict[s
         if current_tier >= 3 and deps_met:
             state = "active"
             active_count += 1
+            active_ids.add(skill_id)
             learned_at = now_local.date().isoformat()
         elif current_tier > 0 and deps_met:
             state = "planned"
@@ -1133,29 +1430,39 @@ def build_skills_payload(workspace_root: Path, now_local: dt.datetime) -> Dict[s
         },
     }
 
-def status_score(status: str) -> float:
-    normalized = (status or "unknown").lower()
-    if normalized in {"ok", "green", "success"}:
-        return 1.0
-    if normalized in {"yellow", "warn", "warning"}:
-        return 0.55
-    if normalized in {"error", "red", "failed"}:
-        return 0.0
-    return 0.35
+
+def latest_trend_points(
+    samples: List[Tuple[int, str, Optional[str]]],
+    limit: int,
+    with_job: bool = False,
+) -> List[Dict[str, Any]]:
+    """Turn the `limit` newest `(ts, status, job)` samples into trend points, oldest-first.
+
+    Bounded `heapq.nlargest` selection; the input index breaks `ts` ties so the result
+    matches a stable sort + tail slice. Labels, scores and dicts are only built for the
+    selected samples. With `with_job`, every point carries `job` (even when null).
+    """
+    newest = heapq.nlargest(limit, zip((sample[0] for sample in samples), itertools.count(), samples))
+    points: List[Dict[str, Any]] = []
+    for _, _, (ts, status, job) in reversed(newest):
+        point: Dict[str, Any] = {
+            "label": format_local_timestamp(ts, "%H:%M"),
+            "status": status,
+            "score": STATUS_SCORES.get(status, STATUS_SCORE_DEFAULT),
+        }
+        if with_job:
+            point["job"] = job
+        points.append(point)
+    return points
 
 
 def job_success_trend(jobs_file: Path, limit: int = 14) -> List[Dict[str, Any]]:
     """Build a recent run-quality trend from job last-run statuses."""
-    content = read_text(jobs_file)
-    if not content:
-        return []
-
-    try:
-        doc = json.loads(content)
-    except json.JSONDecodeError:
+    doc = load_json_doc(jobs_file)
+    if not doc:
         return []
 
-    points: List[Dict[str, Any]] = []
+    samples: List[Tuple[int, str, Optional[str]]] = []
     for job in doc.get("jobs", []):
         if not job.get("enabled"):
             continue
@@ -1165,43 +1472,33 @@ def job_success_trend(jobs_file: Path, limit: int = 14) -> List[Dict[str, Any]]:
         if not isinstance(last_run_ms, int):
             continue
 
-        status = (state.get("lastStatus") or "unknown").lower()
-        label = (
-            dt.datetime.fromtimestamp(last_run_ms / 1000, dt.timezone.utc)
-            .astimezone()
-            .strftime("%H:%M")
-        )
-        points.append(
-            {
-                "label": label,
-                "status": status,
-                "score": status_score(status),
-                "job": job.get("name", ""),
-                "ts": last_run_ms,
-            }
-        )
+        # Interned: trend points repeat a handful of status tokens.
+        status = sys.intern((state.get("lastStatus") or "unknown").lower())
+        samples.append((last_run_ms, status, job.get("name", "")))
 
-    points.sort(key=lambda item: item.get("ts", 0))
-    trimmed = points[-limit:]
-    for point in trimmed:
-        point.pop("ts", None)
-    return trimmed
+    return latest_trend_points(samples, limit, with_job=True)
 
 
 def reliability_trend(log_file: Path, limit: int = 14) -> List[Dict[str, Any]]:
-    """Build reliability trend points from watchdog JSONL logs."""
-    if not log_file.exists():
+    """Build reliability trend points from watchdog JSONL logs.
+
+    The log is append-only, so only the last `limit * RELIABILITY_TREND_TAIL_FACTOR`
+    lines are read, backwards from EOF (headroom for blank/invalid rows).
+    """
+    try:
+        tail = read_tail_lines(log_file, limit * RELIABILITY_TREND_TAIL_FACTOR)
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    points: List[Dict[str, Any]] = []
-    for raw in log_file.read_text(encoding="utf-8").splitlines():
+    samples: List[Tuple[int, str, Optional[str]]] = []
+    for raw in tail:
         line = raw.strip()
         if not line:
             continue
 
         try:
-            row = json.loads(line)
-        except json.JSONDecodeError:
+            row = loads_json(line)
+        except ValueError:
             continue
 
         ts = row.get("ts")
@@ -1214,67 +1511,30 @@ def reliability_trend(log_file: Path, limit: int = 14) -> List[Dict[str, Any]]:
             or ("yellow" if row.get("guardrailTriggered") else "green")
         )
 
-        label = (
-            dt.datetime.fromtimestamp(ts / 1000, dt.timezone.utc)
-            .astimezone()
-            .strftime("%H:%M")
-        )
-
-        points.append(
-            {
-                "label": label,
-                "status": str(status).lower(),
-                "score": status_score(str(status)),
-                "ts": ts,
-            }
-        )
-
-    points.sort(key=lambda item: item.get("ts", 0))
-    trimmed = points[-limit:]
-    for point in trimmed:
-        point.pop("ts", None)
-    return trimmed
+        samples.append((ts, sys.intern(str(status).lower()), None))
 
-
-def finished_run_session_ids(job_id: str, runs_dir: Path, cache: Dict[str, set[str]]) -> set[str]:
-    """Return finished run session ids for a job from cron JSONL run history."""
-    if job_id in cache:
-        return cache[job_id]
-
-    run_file = runs_dir / f"{job_id}.jsonl"
-    if not run_file.exists():
-        cache[job_id] = set()
-        return cache[job_id]
-
-    finished: set[str] = set()
-    for raw in run_file.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        try:
-            row = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-
-        if row.get("action") != "finished":
-            continue
-
-        session_id = row.get("sessionId")
-        if isinstance(session_id, str) and session_id:
-            finished.add(session_id)
-
-    cache[job_id] = finished
-    return finished
+    return latest_trend_points(samples, limit)
 
 
 def parse_timestamp_ms(value: Any) -> Optional[int]:
     if isinstance(value, int):
         return value
-    if not isinstance(value, str) or not value.strip():
+    if not isinstance(value, str):
         return None
+    return parse_iso_timestamp_ms(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_iso_timestamp_ms(value: str) -> Optional[int]:
+    """Parse an ISO-8601 string to epoch ms (naive values are UTC).
 
+    Memoized: the same session/run JSONL tails are re-read on every build, so their
+    timestamps repeat; results depend only on the input string.
+    """
     normalized = value.strip()
-    if normalized.endswith("Z"):
+    if not normalized:
+        return None
+    if normalized[-1] == "Z":
         normalized = normalized[:-1] + "+00:00"
 
     try:
@@ -1319,21 +1579,22 @@ def normalize_runtime_thinking(value: Any) -> Optional[str]:
 
 def read_jsonl_tail(path: Path, max_lines: int = 600) -> List[Dict[str, Any]]:
     """Read the tail of a jsonl file and parse valid JSON objects."""
-    if not path.exists():
+    try:
+        tail = read_tail_lines(path, max_lines)
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
     parsed: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for raw in deque(handle, maxlen=max_lines):
-            line = raw.strip()
-            if not line:
-                continue
-            try:
-                doc = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(doc, dict):
-                parsed.append(doc)
+    for raw in tail:
+        line = raw.strip()
+        if not line:
+            continue
+        try:
+            doc = loads_json(line)
+        except ValueError:
+            continue
+        if isinstance(doc, dict):
+            parsed.append(doc)
     return parsed
 
 
@@ -1374,12 +1635,9 @@ def is_live_pid(pid: int) -> bool:
 
 def main_session_lock_active(session_file: Path, now_ms: int) -> bool:
     lock_file = session_file.with_suffix(f"{session_file.suffix}.lock")
-    if not lock_file.exists():
-        return False
-
     try:
-        lock_doc = json.loads(lock_file.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        lock_doc = loads_json(lock_file.read_bytes())
+    except (FileNotFoundError, NotADirectoryError, ValueError):
         return False
 
     if not isinstance(lock_doc, dict):
@@ -1479,23 +1737,27 @@ def active_main_session_run(
         return None
 
     latest_user_ms: Optional[int] = None
+    latest_user_index = 0
     latest_user_text = ""
-    for event in reversed(events):
-        message = event.get("message")
+    for index in range(len(events) - 1, -1, -1):
+        message = events[index].get("message")
         if not isinstance(message, dict) or message.get("role") != "user":
             continue
 
         latest_user_ms = parse_timestamp_ms(message.get("timestamp"))
         if latest_user_ms is None:
-            latest_user_ms = parse_timestamp_ms(event.get("timestamp"))
+            latest_user_ms = parse_timestamp_ms(events[index].get("timestamp"))
 
+        latest_user_index = index
         latest_user_text = extract_user_text(message.get("content"))
         break
 
     if latest_user_ms is None:
         return None
 
-    tool_events, pending_call_count = collect_main_session_tool_events(events, latest_user_ms)
+    # Session logs are append-only, so the current turn's tool activity follows the latest
+    # user message; scan only that suffix (the timestamp cutoff still applies).
+    tool_events, pending_call_count = collect_main_session_tool_events(events[latest_user_index + 1 :], latest_user_ms)
     if not tool_events:
         return None
 
@@ -1512,11 +1774,7 @@ def active_main_session_run(
         return None
 
     started_at_ms = min(item[0] for item in tool_events)
-    started_local = (
-        dt.datetime.fromtimestamp(started_at_ms / 1000, dt.timezone.utc)
-        .astimezone()
-        .strftime("%Y-%m-%d %H:%M:%S")
-    )
+    started_local = format_local_timestamp(started_at_ms)
 
     unique_tools = sorted({item[1] for item in tool_events})
     tool_summary = ", ".join(unique_tools[:3])
@@ -1587,11 +1845,7 @@ def active_subagent_runs(subagent_registry_path: Path, now_ms: int) -> List[Dict
         if not isinstance(started_at_ms, int):
             continue
 
-        started_local = (
-            dt.datetime.fromtimestamp(started_at_ms / 1000, dt.timezone.utc)
-            .astimezone()
-            .strftime("%Y-%m-%d %H:%M:%S")
-        )
+        started_local = format_local_timestamp(started_at_ms)
         active.append(
             {
                 "jobId": row.get("jobId"),
@@ -1616,75 +1870,74 @@ def collect_cron_terminal_events(job_id: str, runs_dir: Path, cache: Dict[str, L
         return cache[job_id]
 
     run_file = runs_dir / f"{job_id}.jsonl"
-    if not run_file.exists():
+    try:
+        stat = run_file.stat()
+        # Run files are append-only, so an unchanged (mtime, size) means unchanged rows;
+        # reuse the previous build's events instead of re-streaming the whole file.
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _CRON_TERMINAL_EVENTS_CACHE.get(run_file)
+        if cached is not None and cached[0] == signature:
+            cache[job_id] = cached[1]
+            return cached[1]
+        handle = run_file.open("rb")
+    except (FileNotFoundError, NotADirectoryError):
         cache[job_id] = []
         return []
 
     events: List[Dict[str, Any]] = []
-    for raw in run_file.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
+    # Every finished row matters for reconciliation, so stream the whole file rather
+    # than tailing it; rows without a `finished` byte string are skipped undecoded.
+    with handle:
+        for raw in handle:
+            if b"finished" not in raw:
+                continue
 
-        try:
-            row = json.loads(line)
-        except json.JSONDecodeError:
-            continue
+            try:
+                row = loads_json(raw)
+            except ValueError:
+                continue
 
-        if not isinstance(row, dict) or row.get("action") != "finished":
-            continue
+            if not isinstance(row, dict) or row.get("action") != "finished":
+                continue
 
-        session_id = row.get("sessionId")
-        if not isinstance(session_id, str) or not session_id:
-            continue
+            session_id = row.get("sessionId")
+            if not isinstance(session_id, str) or not session_id:
+                continue
 
-        run_key = normalize_run_key("cron", job_id=job_id, session_id=session_id)
-        if run_key is None:
-            continue
+            run_key = normalize_run_key("cron", job_id=job_id, session_id=session_id)
+            if run_key is None:
+                continue
 
-        event_at_ms = (
-            parse_timestamp_ms(row.get("finishedAtMs"))
-            or parse_timestamp_ms(row.get("finishedAt"))
-            or parse_timestamp_ms(row.get("endedAt"))
-            or parse_timestamp_ms(row.get("timestamp"))
-            or parse_timestamp_ms(row.get("ts"))
-        )
-        if event_at_ms is None:
-            continue
+            event_at_ms = (
+                parse_timestamp_ms(row.get("finishedAtMs"))
+                or parse_timestamp_ms(row.get("finishedAt"))
+                or parse_timestamp_ms(row.get("endedAt"))
+                or parse_timestamp_ms(row.get("timestamp"))
+                or parse_timestamp_ms(row.get("ts"))
+            )
+            if event_at_ms is None:
+                continue
 
-        terminal_type = str(row.get("status") or row.get("result") or "finished").lower()
-        if terminal_type in {"ok", "success", "completed", "done"}:
-            terminal_type = "finished"
-        elif terminal_type in {"cancelled", "canceled"}:
-            terminal_type = "cancelled"
-        elif terminal_type in {"timeout", "timedout", "timed_out"}:
-            terminal_type = "timed_out"
-        elif terminal_type in {"failed", "error", "errored"}:
-            terminal_type = "failed"
-        elif terminal_type not in {"finished", "failed", "cancelled", "timed_out"}:
-            terminal_type = "finished"
+            terminal_type = TERMINAL_STATUS_ALIASES.get(
+                str(row.get("status") or row.get("result") or "finished").lower(), "finished"
+            )
 
-        events.append(
-            {
-                "runKey": run_key,
-                "eventType": terminal_type,
-                "eventAtMs": event_at_ms,
-            }
-        )
+            events.append(
+                {
+                    "runKey": run_key,
+                    "eventType": terminal_type,
+                    "eventAtMs": event_at_ms,
+                }
+            )
 
+    _CRON_TERMINAL_EVENTS_CACHE[run_file] = (signature, events)
     cache[job_id] = events
     return events
 
 
 def collect_subagent_runtime_signals(subagent_registry_path: Path) -> Dict[str, List[Dict[str, Any]]]:
-    if not subagent_registry_path.exists():
-        return {"candidates": [], "terminals": []}
-
-    try:
-        registry = json.loads(subagent_registry_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return {"candidates": [], "terminals": []}
-
+    # Parsed once per registry change; signal rows below are always freshly built.
+    registry = load_json_doc(subagent_registry_path)
     if not isinstance(registry, dict):
         return {"candidates": [], "terminals": []}
 
@@ -1721,17 +1974,9 @@ def collect_subagent_runtime_signals(subagent_registry_path: Path) -> Dict[str,
         session_id = session_key
 
         if ended_at_ms is not None:
-            terminal_type = str(entry.get("status") or entry.get("endStatus") or "finished").lower()
-            if terminal_type in {"ok", "success", "completed", "done"}:
-                terminal_type = "finished"
-            elif terminal_type in {"cancelled", "canceled"}:
-                terminal_type = "cancelled"
-            elif terminal_type in {"timeout", "timedout", "timed_out"}:
-                terminal_type = "timed_out"
-            elif terminal_type in {"failed", "error", "errored"}:
-                terminal_type = "failed"
-            elif terminal_type not in {"finished", "failed", "cancelled", "timed_out"}:
-                terminal_type = "finished"
+            terminal_type = TERMINAL_STATUS_ALIASES.get(
+                str(entry.get("status") or entry.get("endStatus") or "finished").lower(), "finished"
+            )
 
             terminals.append(
                 {
@@ -1767,12 +2012,12 @@ def load_materialized_runtime_state(
     now_ms: int,
     max_age_ms: int,
 ) -> Tuple[Optional[Dict[str, Any]], str]:
-    if not runtime_state_path.exists():
-        return None, "materialized-state-missing"
-
-    try:
-        doc = json.loads(runtime_state_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+    # Parsed once per file change; rows are copied below, so the cached doc stays intact.
+    doc = load_json_doc(runtime_state_path)
+    if doc is None:
+        # Only the failure path pays for the extra stat that tells missing from invalid.
+        if not runtime_state_path.exists():
+            return None, "materialized-state-missing"
         return None, "materialized-state-invalid"
 
     if not isinstance(doc, dict):
@@ -1791,7 +2036,9 @@ def load_materialized_runtime_state(
     if not isinstance(active_rows_raw, list):
         return None, "materialized-state-missing-active-runs"
 
-    active_rows: List[Dict[str, Any]] = []
+    # Rows are projected straight onto the published `RuntimeRun` schema (the same one
+    # the live-reconciler path emits) instead of copying every ledger key.
+    keyed_rows: List[Tuple[int, Any, int, Dict[str, Any]]] = []
     for row in active_rows_raw:
         if not isinstance(row, dict):
             continue
@@ -1799,26 +2046,23 @@ def load_materialized_runtime_state(
         if not isinstance(started_at_ms, int):
             continue
 
-        normalized = dict(row)
-        normalized["runningForMs"] = max(0, now_ms - started_at_ms)
-        normalized["startedAtLocal"] = (
-            dt.datetime.fromtimestamp(started_at_ms / 1000, dt.timezone.utc)
-            .astimezone()
-            .strftime("%Y-%m-%d %H:%M:%S")
-        )
-        normalized["summary"] = str(row.get("summary") or row.get("jobName") or "Running activity")
-
-        model = normalize_runtime_model(row.get("model"))
-        if model is not None:
-            normalized["model"] = model
-
-        thinking = normalize_runtime_thinking(row.get("thinking"))
-        if thinking is not None:
-            normalized["thinking"] = thinking
-
-        active_rows.append(normalized)
-
-    active_rows.sort(key=lambda item: (item.get("startedAtMs", 0), item.get("runKey", "")))
+        normalized = {
+            "jobId": row.get("jobId"),
+            "jobName": row.get("jobName"),
+            "sessionId": row.get("sessionId"),
+            "sessionKey": row.get("sessionKey"),
+            "summary": str(row.get("summary") or row.get("jobName") or "Running activity"),
+            "startedAtMs": started_at_ms,
+            "startedAtLocal": format_local_timestamp(started_at_ms),
+            "runningForMs": max(0, now_ms - started_at_ms),
+            "activityType": row.get("activityType", "cron"),
+            "model": normalize_runtime_model(row.get("model")),
+            "thinking": normalize_runtime_thinking(row.get("thinking")),
+        }
+        keyed_rows.append((started_at_ms, row.get("runKey", ""), len(keyed_rows), normalized))
+
+    keyed_rows.sort()
+    active_rows = [item[3] for item in keyed_rows]
     runtime = {
         "status": "running" if active_rows else "idle",
         "isIdle": len(active_rows) == 0,
@@ -1833,6 +2077,34 @@ def load_materialized_runtime_state(
     return runtime, ""
 
 
+def runtime_jobs_index(jobs_file: Path) -> Dict[str, Dict[str, Optional[str]]]:
+    """Return `{job_id: {name, model, thinking}}` for runtime rows, normalized once.
+
+    Rebuilt only when `load_json_doc` hands back a new parse (i.e. the jobs file
+    changed); callers must treat the returned index as read-only.
+    """
+    jobs_doc = load_json_doc(jobs_file)
+    cached = _RUNTIME_JOBS_INDEX_CACHE.get(jobs_file)
+    if cached is not None and cached[0] is jobs_doc:
+        return cached[1]
+
+    jobs_by_id: Dict[str, Dict[str, Optional[str]]] = {}
+    if isinstance(jobs_doc, dict):
+        for job in jobs_doc.get("jobs", []):
+            if not isinstance(job, dict) or not job.get("id"):
+                continue
+            job_id = str(job.get("id"))
+            payload = job.get("payload") if isinstance(job.get("payload"), dict) else {}
+            jobs_by_id[job_id] = {
+                "name": str(job.get("name", "")),
+                "model": normalize_runtime_model(payload.get("model")),
+                "thinking": normalize_runtime_thinking(payload.get("thinking")),
+            }
+
+    _RUNTIME_JOBS_INDEX_CACHE[jobs_file] = (jobs_doc, jobs_by_id)
+    return jobs_by_id
+
+
 def runtime_activity(
     jobs_file: Path,
     sessions_store_path: Path = SESSIONS_STORE_PATH,
@@ -1844,7 +2116,7 @@ def runtime_activity(
     materialized_max_age_ms: int = RUNTIME_MATERIALIZED_MAX_AGE_MS,
 ) -> Dict[str, Any]:
     """Return runtime truth using materialized ledger first, reconciler fallback second."""
-    now_ms = int(dt.datetime.now(dt.timezone.utc).timestamp() * 1000)
+    now_ms = time.time_ns() // 1_000_000
 
     materialized_runtime, materialized_reason = load_materialized_runtime_state(
         runtime_state_path,
@@ -1854,85 +2126,68 @@ def runtime_activity(
     if materialized_runtime is not None:
         return materialized_runtime
 
-    jobs_doc_text = read_text(jobs_file)
-    jobs_by_id: Dict[str, Dict[str, Optional[str]]] = {}
-    if jobs_doc_text:
-        try:
-            jobs_doc = json.loads(jobs_doc_text)
-            for job in jobs_doc.get("jobs", []):
-                if not isinstance(job, dict) or not job.get("id"):
-                    continue
-                job_id = str(job.get("id"))
-                payload = job.get("payload") if isinstance(job.get("payload"), dict) else {}
-                jobs_by_id[job_id] = {
-                    "name": str(job.get("name", "")),
-                    "model": normalize_runtime_model(payload.get("model")),
-                    "thinking": normalize_runtime_thinking(payload.get("thinking")),
-                }
-        except json.JSONDecodeError:
-            jobs_by_id = {}
+    jobs_by_id = runtime_jobs_index(jobs_file)
 
     candidates: List[Dict[str, Any]] = []
     terminal_events: List[Dict[str, Any]] = []
 
     sessions_reason = ""
-    if sessions_store_path.exists():
-        try:
-            sessions_doc = json.loads(sessions_store_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            sessions_doc = None
-            sessions_reason = "sessions-store-invalid"
-
-        if isinstance(sessions_doc, dict):
-            terminal_cache: Dict[str, List[Dict[str, Any]]] = {}
-            for key, meta in sessions_doc.items():
-                if not isinstance(key, str) or not isinstance(meta, dict):
-                    continue
-
-                match = CRON_RUN_SESSION_KEY_RE.match(key)
-                if not match:
-                    continue
-
-                job_id, session_id = match.groups()
-                started_at_ms = parse_timestamp_ms(meta.get("updatedAt"))
-                if started_at_ms is None:
-                    continue
-
-                run_key = normalize_run_key("cron", job_id=job_id, session_id=session_id)
-                if run_key is None:
-                    continue
-
-                job_meta = jobs_by_id.get(job_id) or {}
-                job_name = str(job_meta.get("name") or f"Unknown job ({job_id[:8]})")
-                normalized_job_name = job_name.lower()
-                if any(token in normalized_job_name for token in EXCLUDED_RUNTIME_JOB_NAME_SUBSTRINGS):
-                    continue
-
-                session_model = normalize_runtime_model(meta.get("model"))
-                session_thinking = normalize_runtime_thinking(meta.get("thinking"))
-                model = session_model or job_meta.get("model")
-                thinking = session_thinking or job_meta.get("thinking")
-
-                candidates.append(
-                    {
-                        "runKey": run_key,
-                        "jobId": job_id,
-                        "jobName": job_name,
-                        "sessionId": session_id,
-                        "sessionKey": key,
-                        "summary": job_name,
-                        "startedAtMs": started_at_ms,
-                        "lastSeenAtMs": started_at_ms,
-                        "activityType": "cron",
-                        "model": model,
-                        "thinking": thinking,
-                    }
-                )
-                terminal_events.extend(collect_cron_terminal_events(job_id, runs_dir, terminal_cache))
-        elif not sessions_reason:
-            sessions_reason = "sessions-store-unexpected-shape"
-    else:
+    try:
+        sessions_doc = loads_json(sessions_store_path.read_bytes())
+    except (FileNotFoundError, NotADirectoryError):
+        sessions_doc = None
         sessions_reason = "sessions-store-missing"
+    except ValueError:
+        sessions_doc = None
+        sessions_reason = "sessions-store-invalid"
+
+    if isinstance(sessions_doc, dict):
+        terminal_cache: Dict[str, List[Dict[str, Any]]] = {}
+        for key, meta in sessions_doc.items():
+            if not isinstance(key, str) or not isinstance(meta, dict):
+                continue
+
+            match = CRON_RUN_SESSION_KEY_RE.match(key)
+            if not match:
+                continue
+
+            job_id, session_id = match.groups()
+            started_at_ms = parse_timestamp_ms(meta.get("updatedAt"))
+            if started_at_ms is None:
+                continue
+
+            run_key = normalize_run_key("cron", job_id=job_id, session_id=session_id)
+            if run_key is None:
+                continue
+
+            job_meta = jobs_by_id.get(job_id) or {}
+            job_name = str(job_meta.get("name") or f"Unknown job ({job_id[:8]})")
+            if EXCLUDED_RUNTIME_JOB_NAME_RE.search(job_name.lower()):
+                continue
+
+            session_model = normalize_runtime_model(meta.get("model"))
+            session_thinking = normalize_runtime_thinking(meta.get("thinking"))
+            model = session_model or job_meta.get("model")
+            thinking = session_thinking or job_meta.get("thinking")
+
+            candidates.append(
+                {
+                    "runKey": run_key,
+                    "jobId": job_id,
+                    "jobName": job_name,
+                    "sessionId": session_id,
+                    "sessionKey": key,
+                    "summary": job_name,
+                    "startedAtMs": started_at_ms,
+                    "lastSeenAtMs": started_at_ms,
+                    "activityType": "cron",
+                    "model": model,
+                    "thinking": thinking,
+                }
+            )
+            terminal_events.extend(collect_cron_terminal_events(job_id, runs_dir, terminal_cache))
+    elif not sessions_reason:
+        sessions_reason = "sessions-store-unexpected-shape"
 
     if subagent_registry_path is not None:
         subagent_signals = collect_subagent_runtime_signals(subagent_registry_path)
@@ -1948,21 +2203,9 @@ def runtime_activity(
 
     active_runs: List[Dict[str, Any]] = []
     for row in reconciled["activeRuns"]:
-        active_runs.append(
-            {
-                "jobId": row.get("jobId"),
-                "jobName": row.get("jobName"),
-                "sessionId": row.get("sessionId"),
-                "sessionKey": row.get("sessionKey"),
-                "summary": row.get("summary"),
-                "startedAtMs": row.get("startedAtMs"),
-                "startedAtLocal": row.get("startedAtLocal"),
-                "runningForMs": row.get("runningForMs"),
-                "activityType": row.get("activityType", "cron"),
-                "model": row.get("model"),
-                "thinking": row.get("thinking"),
-            }
-        )
+        run = {key: row.get(key) for key in _ACTIVE_RUN_KEYS}
+        run["activityType"] = row.get("activityType", "cron")
+        active_runs.append(run)
 
     degraded_bits = [bit for bit in [materialized_reason, sessions_reason] if bit]
     return {
@@ -1982,20 +2225,17 @@ def runtime_activity(
 
 def control_room_version() -> str:
     """Read dashboard app version from package.json."""
-    package_json = CONTROL_ROOM_ROOT / "package.json"
-    if not package_json.exists():
-        return "0.0.0"
-
-    try:
-        data = json.loads(package_json.read_text(encoding="utf-8"))
-        return str(data.get("version", "0.0.0"))
-    except Exception:
+    data = load_json_doc(CONTROL_ROOM_ROOT / "package.json")
+    if not isinstance(data, dict):
         return "0.0.0"
+    return str(data.get("version", "0.0.0"))
 
 
 def build_payload(workspace_root: Path, jobs_file: Path) -> Dict[str, Any]:
     """Build the dashboard JSON payload from current workspace state."""
-    now_local = dt.datetime.now()
+    # Read the clock once so generatedAt, generatedAtLocal, and the memory file agree.
+    now_utc = dt.datetime.now(dt.timezone.utc)
+    now_local = now_utc.astimezone().replace(tzinfo=None)
     today_file = workspace_root / "memory" / f"{now_local.strftime('%Y-%m-%d')}.md"
 
     plan_text = read_text(workspace_root / "DAILY_PLAN.md")
@@ -2005,8 +2245,9 @@ def build_payload(workspace_root: Path, jobs_file: Path) -> Dict[str, Any]:
     status_parts = parse_today_status(status_text)
     timeline = parse_daily_plan_blocks(plan_text)
 
-    active_work = resolve_active_work(status_parts.get("activeWork", ""), timeline, now_local)
-    current_focus = resolve_current_focus(status_parts.get("currentFocus", ""), active_work, timeline, now_local)
+    context = timeline_context(timeline, now_local)
+    active_work = resolve_active_work(status_parts.get("activeWork", ""), timeline, now_local, context)
+    current_focus = resolve_current_focus(status_parts.get("currentFocus", ""), active_work, timeline, now_local, context)
 
     next_jobs_rows = next_jobs(jobs_file)
     runtime = runtime_activity(jobs_file, subagent_registry_path=SUBAGENT_REGISTRY_PATH)
@@ -2019,7 +2260,7 @@ def build_payload(workspace_root: Path, jobs_file: Path) -> Dict[str, Any]:
     )
 
     return {
-        "generatedAt": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "generatedAt": now_utc.isoformat(),
         "generatedAtLocal": now_local.strftime("%Y-%m-%d %H:%M %Z"),
         "controlRoomVersion": control_room_version(),
         "currentFocus": current_focus,
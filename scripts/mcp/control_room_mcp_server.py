@@ -8,7 +8,6 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
-import json
 import subprocess
 import sys
 from pathlib import Path
@@ -19,8 +18,9 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from scripts.build_status_json import sanitize_payload_for_static_snapshot  # type: ignore
-from scripts.extract_release_notes import extract_release_notes  # type: ignore
+from scripts.extract_release_notes import extract_release_notes_from_file  # type: ignore
 from scripts.issue_snapshot import render_markdown, run_gh_issue_list  # type: ignore
+from scripts.lib.fastjson import write_json  # type: ignore
 from scripts.lib.status_builder import build_payload  # type: ignore
 from scripts.mcp.jsonrpc_stdio import (  # type: ignore
     ProtocolError,
@@ -163,7 +163,7 @@ def tool_status_build(arguments: Dict[str, Any]) -> Dict[str, Any]:
         payload = sanitize_payload_for_static_snapshot(payload)
 
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    write_json(out, payload)
 
     runtime = payload.get("runtime") if isinstance(payload, dict) else {}
     active_count = runtime.get("activeCount") if isinstance(runtime, dict) else 0
@@ -189,7 +189,7 @@ def tool_release_extract(arguments: Dict[str, Any]) -> Dict[str, Any]:
     if isinstance(out_raw, str) and out_raw.strip():
         out_path = _resolve_path(out_raw, ROOT / f"status/release-notes-{version}.md")
 
-    notes = extract_release_notes(changelog.read_text(encoding="utf-8"), version)
+    notes = extract_release_notes_from_file(changelog, version)
 
     if out_path is not None:
         out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -14,6 +14,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from scripts.lib.fastjson import dumps_pretty
 from scripts.lib.status_builder import build_payload
 
 
@@ -63,7 +64,7 @@ def main() -> int:
     gist_id = resolve_gist_id(args.gist_id, Path(args.gist_id_file))
 
     payload = build_payload(workspace, jobs_file)
-    content = json.dumps(payload, indent=2) + "\n"
+    content = dumps_pretty(payload)
 
     patch_body = {
         "files": {
@@ -7,6 +7,7 @@ python3 -m py_compile \
   scripts/extract_release_notes.py \
   scripts/issue_snapshot.py \
   scripts/lib/status_builder.py \
+  scripts/lib/fastjson.py \
   scripts/lib/runtime_events.py \
   scripts/lib/runtime_reconciler.py \
   scripts/mcp/jsonrpc_stdio.py \
@@ -22,7 +23,8 @@ python3 -m py_compile \
   scripts/tests/test_runtime_materializer.py \
   scripts/tests/test_runtime_truth_stress.py \
   scripts/tests/test_control_room_mcp_flow.py \
-  scripts/tests/test_collapsible_heading_compact.py
+  scripts/tests/test_collapsible_heading_compact.py \
+  scripts/tests/test_fastjson.py
 
 python3 scripts/tests/test_extract_release_notes.py
 python3 scripts/tests/test_issue_snapshot.py
@@ -32,6 +34,7 @@ python3 scripts/tests/test_runtime_materializer.py
 python3 scripts/tests/test_runtime_truth_stress.py
 python3 scripts/tests/test_control_room_mcp_flow.py
 python3 scripts/tests/test_collapsible_heading_compact.py
+python3 scripts/tests/test_fastjson.py
 python3 scripts/build_status_json.py > /dev/null
 
 # Frontend checks
@@ -22,11 +22,9 @@ CRON_RUN_SESSION_KEY_RE = re.compile(r"^agent:main:cron:([^:]+):run:([^:]+)$")
 
 
 def read_json(path: Path) -> Any:
-    if not path.exists():
-        return None
     try:
         return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+    except (FileNotFoundError, NotADirectoryError, json.JSONDecodeError):
         return None
 
 
@@ -159,61 +157,60 @@ def collect_session_events(sessions_file: Path, jobs_by_id: Dict[str, Dict[str,
 
 
 def collect_cron_terminal_events(runs_dir: Path) -> List[Dict[str, Any]]:
-    if not runs_dir.exists():
-        return []
-
+    # glob() on a missing directory yields nothing, so no separate exists() probe.
     events: List[Dict[str, Any]] = []
     for run_file in sorted(runs_dir.glob("*.jsonl")):
         job_id = run_file.stem
-        for line_index, raw in enumerate(run_file.read_text(encoding="utf-8").splitlines(), start=1):
-            line = raw.strip()
-            if not line:
-                continue
-
-            try:
-                row = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            if not isinstance(row, dict):
-                continue
-            if row.get("action") != "finished":
-                continue
-
-            session_id = row.get("sessionId")
-            if not isinstance(session_id, str) or not session_id:
-                continue
-
-            event_at_ms = (
-                parse_timestamp_ms(row.get("finishedAtMs"))
-                or parse_timestamp_ms(row.get("finishedAt"))
-                or parse_timestamp_ms(row.get("endedAt"))
-                or parse_timestamp_ms(row.get("timestamp"))
-                or parse_timestamp_ms(row.get("ts"))
-            )
-            if event_at_ms is None:
-                continue
-
-            run_key = normalize_run_key("cron", job_id=job_id, session_id=session_id)
-            if run_key is None:
-                continue
-
-            terminal_type = normalize_terminal_event_type(row.get("status") or row.get("result") or "finished")
-            payload = {
-                "jobId": job_id,
-                "sessionId": session_id,
-                "status": terminal_type,
-            }
-            events.append(
-                build_event(
-                    run_key=run_key,
-                    event_type=terminal_type,
-                    event_at_ms=event_at_ms,
-                    source="cron-runs",
-                    source_offset=f"{run_file.name}:{line_index}",
-                    payload=payload,
+        with run_file.open(encoding="utf-8") as handle:
+            for line_index, raw in enumerate(handle, start=1):
+                line = raw.strip()
+                if not line:
+                    continue
+
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                if not isinstance(row, dict):
+                    continue
+                if row.get("action") != "finished":
+                    continue
+
+                session_id = row.get("sessionId")
+                if not isinstance(session_id, str) or not session_id:
+                    continue
+
+                event_at_ms = (
+                    parse_timestamp_ms(row.get("finishedAtMs"))
+                    or parse_timestamp_ms(row.get("finishedAt"))
+                    or parse_timestamp_ms(row.get("endedAt"))
+                    or parse_timestamp_ms(row.get("timestamp"))
+                    or parse_timestamp_ms(row.get("ts"))
+                )
+                if event_at_ms is None:
+                    continue
+
+                run_key = normalize_run_key("cron", job_id=job_id, session_id=session_id)
+                if run_key is None:
+                    continue
+
+                terminal_type = normalize_terminal_event_type(row.get("status") or row.get("result") or "finished")
+                payload = {
+                    "jobId": job_id,
+                    "sessionId": session_id,
+                    "status": terminal_type,
+                }
+                events.append(
+                    build_event(
+                        run_key=run_key,
+                        event_type=terminal_type,
+                        event_at_ms=event_at_ms,
+                        source="cron-runs",
+                        source_offset=f"{run_file.name}:{line_index}",
+                        payload=payload,
+                    )
                 )
-            )
 
     return events
 
@@ -301,23 +298,24 @@ def collect_subagent_events(subagent_file: Path) -> List[Dict[str, Any]]:
 
 
 def load_existing_event_ids(events_file: Path) -> Set[str]:
-    if not events_file.exists():
-        return set()
-
     ids: Set[str] = set()
-    for raw in events_file.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        try:
-            row = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(row, dict):
-            continue
-        event_id = row.get("eventId")
-        if isinstance(event_id, str) and event_id:
-            ids.add(event_id)
+    try:
+        with events_file.open(encoding="utf-8") as handle:
+            for raw in handle:
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(row, dict):
+                    continue
+                event_id = row.get("eventId")
+                if isinstance(event_id, str) and event_id:
+                    ids.add(event_id)
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
     return ids
 
 
@@ -8,6 +8,8 @@ import datetime as dt
 import json
 import re
 import sys
+import time
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
 
@@ -15,36 +17,35 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from scripts.lib.fastjson import write_json
 from scripts.lib.runtime_events import RUNNING_EVENT_TYPES, is_terminal_event_type, sort_events
 
 REVISION_RE = re.compile(r"^rtv1-(\d+)$")
 
 
 def read_events(events_file: Path) -> List[Dict[str, Any]]:
-    if not events_file.exists():
-        return []
-
     events: List[Dict[str, Any]] = []
-    for raw in events_file.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        try:
-            row = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(row, dict):
-            events.append(row)
+    try:
+        with events_file.open(encoding="utf-8") as handle:
+            for raw in handle:
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(row, dict):
+                    events.append(row)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
     return sort_events(events)
 
 
 def parse_revision_number(runtime_state_file: Path) -> int:
-    if not runtime_state_file.exists():
-        return 0
-
     try:
         current = json.loads(runtime_state_file.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+    except (FileNotFoundError, NotADirectoryError, json.JSONDecodeError):
         return 0
 
     if not isinstance(current, dict):
@@ -182,7 +183,8 @@ def reduce_events(
             dropped_stale += 1
 
     active_rows = [make_runtime_row(run_key, state, now_ms) for run_key, state in active.items()]
-    active_rows.sort(key=lambda row: (row.get("startedAtMs", 0), row.get("runKey", "")))
+    # make_runtime_row always sets an int startedAtMs and a str runKey.
+    active_rows.sort(key=itemgetter("startedAtMs", "runKey"))
     return active_rows, terminals, dropped_stale
 
 
@@ -194,7 +196,7 @@ def materialize_runtime_state(
     stale_ms: int = 10 * 60 * 1000,
 ) -> Dict[str, Any]:
     if now_ms is None:
-        now_ms = int(dt.datetime.now(dt.timezone.utc).timestamp() * 1000)
+        now_ms = time.time_ns() // 1_000_000
 
     events = read_events(events_file)
     active_rows, terminals, dropped_stale = reduce_events(events, now_ms=now_ms, stale_ms=stale_ms)
@@ -216,7 +218,7 @@ def materialize_runtime_state(
     }
 
     runtime_state_file.parent.mkdir(parents=True, exist_ok=True)
-    runtime_state_file.write_text(json.dumps(runtime_state, indent=2) + "\n", encoding="utf-8")
+    write_json(runtime_state_file, runtime_state)
     return runtime_state
 
 
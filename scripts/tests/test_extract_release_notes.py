@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import tempfile
 import unittest
 from pathlib import Path
 import sys
@@ -10,7 +11,7 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from scripts.extract_release_notes import extract_release_notes
+from scripts.extract_release_notes import extract_release_notes, extract_release_notes_from_file
 
 
 class ExtractReleaseNotesTests(unittest.TestCase):
@@ -30,6 +31,15 @@ class ExtractReleaseNotesTests(unittest.TestCase):
         self.assertIn("- One", notes)
         self.assertNotIn("v0.9.0", notes)
 
+    def test_extract_section_from_file_matches_text(self) -> None:
+        changelog = "# Changelog\n\n## v1.1.0 - 2026-02-18\n- New\n\n## v1.0.0 - 2026-02-17\n- One\n"
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "CHANGELOG.md"
+            path.write_text(changelog, encoding="utf-8")
+            notes = extract_release_notes_from_file(path, "1.1.0")
+        self.assertEqual(notes, extract_release_notes(changelog, "1.1.0"))
+        self.assertNotIn("v1.0.0", notes)
+
     def test_missing_version_raises(self) -> None:
         with self.assertRaises(ValueError):
             extract_release_notes("# Changelog\n", "9.9.9")
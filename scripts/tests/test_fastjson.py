@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Tests for pretty JSON writer helpers."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import sys
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.lib import fastjson
+from scripts.lib.fastjson import dumps_pretty, dumps_pretty_bytes, loads, write_json
+
+
+class FastJsonTests(unittest.TestCase):
+    def test_dumps_pretty_is_indented_with_trailing_newline(self) -> None:
+        text = dumps_pretty({"runtime": {"activeRuns": []}, "label": "09:00 — Block"})
+        self.assertTrue(text.endswith("\n"))
+        self.assertIn('\n  "runtime": {\n', text)
+        self.assertEqual(json.loads(text)["label"], "09:00 — Block")
+
+    def test_write_json_round_trips(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            out = Path(td) / "status.json"
+            payload = {"generatedAt": "2026-02-18T09:00:00+00:00", "nextJobs": [{"name": "Job"}]}
+            write_json(out, payload)
+            self.assertEqual(json.loads(out.read_text(encoding="utf-8")), payload)
+
+    def test_loads_accepts_utf8_bytes(self) -> None:
+        raw = '{"data": {"repository": {"issues": {"nodes": [{"title": "Fix — lane"}]}}}}'.encode("utf-8")
+        doc = loads(raw)
+        self.assertEqual(doc["data"]["repository"]["issues"]["nodes"][0]["title"], "Fix — lane")
+
+    def test_stdlib_fallback_writes_same_bytes_as_orjson(self) -> None:
+        payload = {
+            "label": "09:00 — Block",
+            "emoji": "✅",
+            "counts": {1: "one", 2: "two"},
+            "score": 0.55,
+            "runs": [],
+            "meta": {"ok": True, "missing": None},
+        }
+        fast = dumps_pretty_bytes(payload)
+        saved = fastjson.orjson
+        fastjson.orjson = None
+        try:
+            fallback = dumps_pretty_bytes(payload)
+        finally:
+            fastjson.orjson = saved
+
+        self.assertIn("09:00 — Block".encode("utf-8"), fallback)
+        self.assertNotIn(b"\\u2014", fallback)
+        self.assertIn(b'"1": "one"', fallback)
+        self.assertEqual(fast, fallback)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import argparse
+import json
 import unittest
 from pathlib import Path
 import sys
@@ -10,7 +12,7 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from scripts.issue_snapshot import render_markdown
+from scripts.issue_snapshot import flatten_issue_nodes, positive_int, render_markdown, run_gh_issue_list
 
 
 class IssueSnapshotTests(unittest.TestCase):
@@ -34,6 +36,68 @@ class IssueSnapshotTests(unittest.TestCase):
         self.assertIn("Fix duplicate next items", md)
         self.assertIn("qa, bug", md)
 
+    def test_flatten_graphql_issue_nodes(self) -> None:
+        doc = {
+            "data": {
+                "repository": {
+                    "issues": {
+                        "nodes": [
+                            {
+                                "number": 7,
+                                "title": "Stale runtime row",
+                                "url": "https://example.com/7",
+                                "updatedAt": "2026-02-18T09:00:00Z",
+                                "author": {"login": "octocat"},
+                                "labels": {"nodes": [{"name": "bug"}]},
+                            }
+                        ]
+                    }
+                }
+            }
+        }
+        issues = flatten_issue_nodes(doc)
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(issues[0]["labels"], [{"name": "bug"}])
+        self.assertIn("bug", render_markdown("owner/repo", issues))
+        self.assertEqual(flatten_issue_nodes({"data": {"repository": None}}), [])
+
+    def test_issue_list_paginates_past_one_graphql_page(self) -> None:
+        calls: list[list[str]] = []
+
+        def fake_check_output(cmd: list[str]) -> bytes:
+            calls.append(cmd)
+            page_size = int(next(arg for arg in cmd if arg.startswith("limit=")).split("=", 1)[1])
+            start = 100 * (len(calls) - 1)
+            nodes = [{"number": start + offset, "labels": {"nodes": []}} for offset in range(page_size)]
+            page_info = {"hasNextPage": True, "endCursor": f"cursor-{len(calls)}"}
+            doc = {"data": {"repository": {"issues": {"pageInfo": page_info, "nodes": nodes}}}}
+            return json.dumps(doc).encode("utf-8")
+
+        issues = run_gh_issue_list("owner/repo", 250, check_output=fake_check_output)
+        self.assertEqual(len(issues), 250)
+        self.assertEqual([issue["number"] for issue in issues[:2]], [0, 1])
+        self.assertIn("limit=50", calls[2])
+        self.assertNotIn("after=cursor-1", calls[0])
+        self.assertIn("after=cursor-1", calls[1])
+        self.assertIn("after=cursor-2", calls[2])
+
+    def test_issue_list_stops_on_last_page(self) -> None:
+        calls: list[list[str]] = []
+
+        def fake_check_output(cmd: list[str]) -> bytes:
+            calls.append(cmd)
+            page_info = {"hasNextPage": False, "endCursor": "cursor-1"}
+            doc = {"data": {"repository": {"issues": {"pageInfo": page_info, "nodes": [{"number": 1}]}}}}
+            return json.dumps(doc).encode("utf-8")
+
+        self.assertEqual(len(run_gh_issue_list("owner/repo", 200, check_output=fake_check_output)), 1)
+        self.assertEqual(len(calls), 1)
+
+    def test_limit_must_be_positive(self) -> None:
+        self.assertEqual(positive_int("200"), 200)
+        with self.assertRaises(argparse.ArgumentTypeError):
+            positive_int("0")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import tempfile
 import unittest
@@ -14,11 +15,19 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from scripts.lib.runtime_events import build_event
+from scripts.lib.runtime_events import build_event, deterministic_event_id
 from scripts.runtime.materialize_runtime_state import materialize_runtime_state, reduce_events
 
 
 class RuntimeMaterializerTests(unittest.TestCase):
+    def test_deterministic_event_id_is_stable_sha256_of_material(self) -> None:
+        # Journal de-duplication relies on ids matching those already persisted.
+        expected = hashlib.sha256(b"cron:job-1:session-a|finished|1000|cron-runs|job-1.jsonl:3").hexdigest()
+        self.assertEqual(
+            deterministic_event_id("cron:job-1:session-a", "finished", 1000, "cron-runs", "job-1.jsonl:3"),
+            expected,
+        )
+
     def test_reduce_events_start_then_finish_removes_run(self) -> None:
         now_ms = 2_000_000
         run_key = "cron:job-1:session-a"
@@ -12,7 +12,7 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from scripts.lib.runtime_reconciler import normalize_run_key, reconcile
+from scripts.lib.runtime_reconciler import collect_candidates, normalize_run_key, reconcile
 
 
 class RuntimeReconcilerTests(unittest.TestCase):
@@ -24,6 +24,18 @@ class RuntimeReconcilerTests(unittest.TestCase):
         self.assertEqual(normalize_run_key("subagent", run_id="run-1"), "subagent:run-1")
         self.assertIsNone(normalize_run_key("cron", job_id="job-1"))
 
+    def test_collect_candidates_merges_and_sorts_by_start_then_run_key(self) -> None:
+        rows = collect_candidates(
+            [
+                {"runKey": "cron:b", "startedAtMs": 2_000},
+                {"runKey": "cron:a", "startedAtMs": 2_000},
+                {"runKey": "cron:c", "startedAtMs": 3_000},
+                {"runKey": "cron:c", "startedAtMs": 1_000, "jobName": "Late fill"},
+            ]
+        )
+        self.assertEqual([row["runKey"] for row in rows], ["cron:c", "cron:a", "cron:b"])
+        self.assertEqual(rows[0]["jobName"], "Late fill")
+
     def test_reconcile_terminal_event_removes_lingering_candidate(self) -> None:
         now_ms = 1_000_000
         result = reconcile(
@@ -23,12 +23,20 @@ from scripts.lib.status_builder import (
     build_payload,
     build_skills_payload,
     build_workstream_lanes,
+    collect_cron_terminal_events,
+    dedupe_next_lane,
+    job_success_trend,
+    load_json_doc,
     parse_daily_plan_blocks,
+    parse_hhmm_to_minutes,
     parse_today_status,
     recent_activity,
+    reliability_status,
     resolve_active_work,
     runtime_activity,
+    runtime_jobs_index,
     sanitize_payload_for_static_snapshot,
+    timeline_context,
 )
 
 
@@ -44,6 +52,14 @@ class StatusBuilderTests(unittest.TestCase):
         self.assertEqual(blocks[0]["time"], "13:20-13:45")
         self.assertIn("Midday reliability", blocks[0]["task"])
 
+    def test_parse_hhmm_to_minutes_accepts_lenient_clock_times(self) -> None:
+        self.assertEqual(parse_hhmm_to_minutes("09:05"), 545)
+        self.assertEqual(parse_hhmm_to_minutes("9:5"), 545)
+        self.assertEqual(parse_hhmm_to_minutes(" 9:05"), 545)
+        self.assertIsNone(parse_hhmm_to_minutes("24:00"))
+        self.assertIsNone(parse_hhmm_to_minutes("9:60"))
+        self.assertIsNone(parse_hhmm_to_minutes("905"))
+
     def test_parse_today_status(self) -> None:
         md = """
 - Primary focus: reliability first
@@ -53,6 +69,98 @@ class StatusBuilderTests(unittest.TestCase):
         self.assertEqual(parsed["currentFocus"], "reliability first")
         self.assertIn("queue cleanup", parsed["activeWork"])
 
+    def test_timeline_context_keeps_plan_order_and_last_active_block(self) -> None:
+        timeline = [
+            {"time": "15:00-16:00", "task": "Later"},
+            {"time": "09:00-10:00", "task": "Morning"},
+            {"time": "11:00-13:00", "task": "Long block"},
+            {"time": "14:00-14:30", "task": "Soon"},
+            {"time": "11:30-12:30", "task": "Overlap"},
+        ]
+        context = timeline_context(timeline, dt.datetime(2026, 2, 20, 12, 0))
+        self.assertEqual(context["current"]["task"], "Overlap")
+        self.assertEqual([block["task"] for block in context["next"]], ["Later", "Soon"])
+        self.assertEqual([block["task"] for block in context["completed"]], ["Morning"])
+
+    def test_load_json_doc_reuses_parse_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            jobs_file = Path(tmp) / "jobs.json"
+            self.assertIsNone(load_json_doc(jobs_file))
+
+            jobs_file.write_text(json.dumps({"jobs": [{"id": "a"}]}), encoding="utf-8")
+            first = load_json_doc(jobs_file)
+            self.assertIs(load_json_doc(jobs_file), first)
+
+            jobs_file.write_text(json.dumps({"jobs": [{"id": "a"}, {"id": "b"}]}), encoding="utf-8")
+            self.assertEqual(len(load_json_doc(jobs_file)["jobs"]), 2)
+
+            jobs_file.write_text("{not json", encoding="utf-8")
+            self.assertIsNone(load_json_doc(jobs_file))
+
+    def test_runtime_jobs_index_rebuilds_only_when_jobs_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            jobs_file = Path(tmp) / "jobs.json"
+            self.assertEqual(runtime_jobs_index(jobs_file), {})
+
+            jobs_file.write_text(
+                json.dumps({"jobs": [{"id": "a", "name": "Alpha", "payload": {"model": "openai/gpt-5"}}]}),
+                encoding="utf-8",
+            )
+            first = runtime_jobs_index(jobs_file)
+            self.assertEqual(first["a"]["name"], "Alpha")
+            self.assertIs(runtime_jobs_index(jobs_file), first)
+
+            jobs_file.write_text(
+                json.dumps({"jobs": [{"id": "a", "name": "Alpha"}, {"id": "b", "name": "Beta"}]}),
+                encoding="utf-8",
+            )
+            self.assertEqual(sorted(runtime_jobs_index(jobs_file)), ["a", "b"])
+
+    def test_job_success_trend_keeps_job_key_for_null_names(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            jobs_file = Path(tmp) / "jobs.json"
+            jobs_file.write_text(
+                json.dumps(
+                    {
+                        "jobs": [
+                            {"enabled": True, "name": None, "state": {"lastRunAtMs": 1_000, "lastStatus": "ok"}},
+                            {"enabled": True, "name": "Beta", "state": {"lastRunAtMs": 2_000, "lastStatus": "error"}},
+                        ]
+                    }
+                ),
+                encoding="utf-8",
+            )
+            trend = job_success_trend(jobs_file)
+            self.assertEqual([point["job"] for point in trend], [None, "Beta"])
+
+    def test_collect_cron_terminal_events_rereads_appended_run_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            runs_dir = Path(tmp)
+            run_file = runs_dir / "job-1.jsonl"
+            row = {"action": "finished", "sessionId": "session-a", "status": "ok", "finishedAtMs": 1_000}
+            run_file.write_text(json.dumps(row) + "\n", encoding="utf-8")
+
+            first = collect_cron_terminal_events("job-1", runs_dir, {})
+            self.assertEqual([event["runKey"] for event in first], ["cron:job-1:session-a"])
+            self.assertIs(collect_cron_terminal_events("job-1", runs_dir, {}), first)
+
+            with run_file.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps({**row, "sessionId": "session-b", "finishedAtMs": 2_000}) + "\n")
+            self.assertEqual(len(collect_cron_terminal_events("job-1", runs_dir, {})), 2)
+
+    def test_dedupe_next_lane_drops_semantic_duplicates(self) -> None:
+        timeline_items = [
+            "13:20-13:45 — Midday reliability + queue reconciliation",
+            "15:00-15:30 — Release notes review",
+        ]
+        status_items = [
+            "13:25-13:50 — Queue reconciliation and midday reliability pass",
+            "Release notes review",
+            "16:00-16:30 — Dashboard accessibility audit",
+        ]
+        deduped = dedupe_next_lane(timeline_items, status_items)
+        self.assertEqual(deduped, timeline_items + ["16:00-16:30 — Dashboard accessibility audit"])
+
     def test_workstream_running_activity_precedence(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             root = Path(td)
@@ -339,6 +447,22 @@ class StatusBuilderTests(unittest.TestCase):
             self.assertEqual(runtime["activeRuns"][0]["sessionId"], "session-active")
             self.assertEqual(runtime["activeRuns"][0]["jobName"], "Job One")
             self.assertEqual(runtime["activeRuns"][0]["activityType"], "cron")
+            self.assertEqual(
+                list(runtime["activeRuns"][0]),
+                [
+                    "jobId",
+                    "jobName",
+                    "sessionId",
+                    "sessionKey",
+                    "summary",
+                    "startedAtMs",
+                    "startedAtLocal",
+                    "runningForMs",
+                    "activityType",
+                    "model",
+                    "thinking",
+                ],
+            )
             self.assertEqual(runtime["source"], "live-reconciler")
             self.assertEqual(runtime["snapshotMode"], "live")
 
@@ -674,6 +798,7 @@ class StatusBuilderTests(unittest.TestCase):
             self.assertEqual(runtime["source"], "materialized-ledger")
             self.assertEqual(runtime["activeCount"], 1)
             self.assertEqual(runtime["activeRuns"][0]["jobName"], "Materialized Job")
+            self.assertNotIn("runKey", runtime["activeRuns"][0])
             self.assertEqual(runtime["revision"], "rtv1-00000123")
 
     def test_runtime_activity_falls_back_when_materialized_state_is_stale(self) -> None:
@@ -862,6 +987,100 @@ class StatusBuilderTests(unittest.TestCase):
             self.assertIn("Live sample block", payload["currentFocus"])
             self.assertGreaterEqual(len(payload["workstream"]["now"]), 1)
 
+    def test_reliability_status_reuses_cached_report_until_script_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            workspace = Path(td)
+            runs_log = workspace / "runs.log"
+            script = workspace / "scripts" / "reliability_watchdog_report.py"
+            script.parent.mkdir(parents=True, exist_ok=True)
+            script.write_text(
+                "import json\n"
+                f"open({str(runs_log)!r}, 'a').write('x')\n"
+                "print(json.dumps({'health': {'status': 'green'}}))\n",
+                encoding="utf-8",
+            )
+
+            self.assertEqual(reliability_status(workspace), {"status": "green"})
+            self.assertEqual(reliability_status(workspace), {"status": "green"})
+            self.assertEqual(runs_log.read_text(encoding="utf-8"), "x")
+            self.assertFalse((workspace / ".cache").exists())
+
+            script.write_text(
+                "import json\nprint(json.dumps({'health': {'status': 'red'}}))\n",
+                encoding="utf-8",
+            )
+            self.assertEqual(reliability_status(workspace), {"status": "red"})
+            self.assertEqual(reliability_status(workspace, cache_ttl_seconds=0), {"status": "red"})
+
+    def test_reliability_status_runs_build_report_in_process(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            workspace = Path(td)
+            script = workspace / "scripts" / "reliability_watchdog_report.py"
+            script.parent.mkdir(parents=True, exist_ok=True)
+            script.write_text(
+                "import json\n"
+                "CONTROL_ROOM_IN_PROCESS_REPORT = True\n"
+                "def build_report(window_hours=8.0):\n"
+                "    return {'health': {'status': 'green' if window_hours == 4.0 else 'yellow'}}\n"
+                "if __name__ == '__main__':\n"
+                "    print(json.dumps({'health': {'status': 'red'}}))\n",
+                encoding="utf-8",
+            )
+
+            self.assertEqual(reliability_status(workspace, window_hours=4.0, cache_ttl_seconds=0), {"status": "green"})
+
+    def test_reliability_status_falls_back_to_subprocess_when_build_report_fails(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            workspace = Path(td)
+            script = workspace / "scripts" / "reliability_watchdog_report.py"
+            script.parent.mkdir(parents=True, exist_ok=True)
+            script.write_text(
+                "import json\n"
+                "CONTROL_ROOM_IN_PROCESS_REPORT = True\n"
+                "def build_report(window_hours=8.0):\n"
+                "    raise RuntimeError('in-process path unavailable')\n"
+                "if __name__ == '__main__':\n"
+                "    print(json.dumps({'health': {'status': 'yellow'}}))\n",
+                encoding="utf-8",
+            )
+
+            self.assertEqual(reliability_status(workspace, cache_ttl_seconds=0), {"status": "yellow"})
+
+    def test_reliability_status_falls_back_to_subprocess_when_build_report_exits(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            workspace = Path(td)
+            script = workspace / "scripts" / "reliability_watchdog_report.py"
+            script.parent.mkdir(parents=True, exist_ok=True)
+            script.write_text(
+                "import json, sys\n"
+                "CONTROL_ROOM_IN_PROCESS_REPORT = True\n"
+                "def build_report(window_hours=8.0):\n"
+                "    sys.exit(2)\n"
+                "if __name__ == '__main__':\n"
+                "    print(json.dumps({'health': {'status': 'yellow'}}))\n",
+                encoding="utf-8",
+            )
+
+            self.assertEqual(reliability_status(workspace, cache_ttl_seconds=0), {"status": "yellow"})
+
+    def test_reliability_status_does_not_import_scripts_without_marker(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            workspace = Path(td)
+            script = workspace / "scripts" / "reliability_watchdog_report.py"
+            script.parent.mkdir(parents=True, exist_ok=True)
+            # Loose `def build_report(` text is not an opt-in; only the subprocess runs, so
+            # the CLI output (yellow) wins over the in-process builder (green).
+            script.write_text(
+                "import json\n"
+                "# def build_report(window_hours=8.0): mentioned in a comment only\n"
+                "def build_report (window_hours=8.0):\n"
+                "    return {'health': {'status': 'green'}}\n"
+                "print(json.dumps({'health': {'status': 'yellow'}}))\n",
+                encoding="utf-8",
+            )
+
+            self.assertEqual(reliability_status(workspace, cache_ttl_seconds=0), {"status": "yellow"})
+
     def test_sanitize_payload_for_static_snapshot_clears_runtime_runs(self) -> None:
         payload = {
             "runtime": {